@@ -5,7 +5,9 @@ from pathlib import Path
 import pytest
 from django.conf import settings
 from django.contrib.admin.utils import flatten
+from django.core.cache import caches
 from django.core.management import call_command
+from django.db import transaction
 
 from rdmo.accounts.utils import set_group_permissions
 
@@ -19,6 +21,32 @@ def django_db_setup(django_db_setup, django_db_blocker):
         set_group_permissions()
 
 
+@pytest.fixture
+def db(db, monkeypatch):
+    # the tests run inside a transaction, which is never committed, therefore the on_commit
+    # callbacks are run as soon as the tested code has left all of its atomic blocks
+    connection = transaction.get_connection()
+    depth = len(connection.savepoint_ids)
+    on_commit, atomic_exit = connection.on_commit, transaction.Atomic.__exit__
+
+    def run_on_commit():
+        if len(connection.savepoint_ids) == depth:
+            callbacks, connection.run_on_commit = connection.run_on_commit, []
+            for sids, func in callbacks:
+                func()
+
+    def patched_on_commit(func):
+        on_commit(func)
+        run_on_commit()
+
+    def patched_atomic_exit(self, *args):
+        atomic_exit(self, *args)
+        run_on_commit()
+
+    monkeypatch.setattr(connection, 'on_commit', patched_on_commit)
+    monkeypatch.setattr(transaction.Atomic, '__exit__', patched_atomic_exit)
+
+
 @pytest.fixture
 def files():
     def setup():
@@ -27,3 +55,11 @@ def files():
 
     setup()
     return setup
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # the caches are not reset between tests, like the database,
+    # but rendered views and versions depend on the content of the database
+    for cache in caches.all():
+        cache.clear()
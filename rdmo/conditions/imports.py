@@ -1,7 +1,7 @@
 import logging
 
-from rdmo.core.imports import (get_foreign_field, set_common_fields,
-                               validate_instance)
+from rdmo.core.imports import (get_foreign_field, get_instance,
+                               set_common_fields, validate_instance)
 from rdmo.domain.models import Attribute
 from rdmo.options.models import Option
 
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 def import_condition(element, save=False):
     try:
-        condition = Condition.objects.get(uri=element.get('uri'))
+        condition = get_instance(Condition, element.get('uri'))
     except Condition.DoesNotExist:
         condition = Condition()
 
@@ -1,9 +1,14 @@
+import operator
+
 from django.conf import settings
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 from rdmo.core.utils import copy_model, join_url
 from rdmo.domain.models import Attribute
 
+# process wide cache for the compiled predicates of the conditions
+predicates = {}
+
 
 class Condition(models.Model):
 
@@ -27,6 +32,12 @@ class Condition(models.Model):
         (RELATION_EMPTY, 'is empty'),
         (RELATION_NOT_EMPTY, 'is not empty'),
     )
+    NUMERIC_RELATIONS = {
+        RELATION_GREATER_THAN: operator.gt,
+        RELATION_GREATER_THAN_EQUAL: operator.ge,
+        RELATION_LESSER_THAN: operator.lt,
+        RELATION_LESSER_THAN_EQUAL: operator.le
+    }
 
     uri = models.URLField(
         max_length=640, blank=True,
@@ -86,6 +97,9 @@ class Condition(models.Model):
         self.uri = self.build_uri(self.uri_prefix, self.key)
         super().save(*args, **kwargs)
 
+        # invalidate the compiled predicate of this condition
+        predicates.pop(self.pk, None)
+
     def copy(self, uri_prefix, key):
         condition = copy_model(self, uri_prefix=uri_prefix, key=key, source=self.source, target_option=self.target_option)
 
@@ -110,110 +124,97 @@ class Condition(models.Model):
     def is_locked(self):
         return self.locked
 
-    def resolve(self, project, snapshot=None):
-        # get the values for the given project, the given snapshot and the condition's attribute
-        values = project.values.filter(snapshot=snapshot).filter(attribute=self.source)
-
-        if self.relation == self.RELATION_EQUAL:
-            return self._resolve_equal(values)
-
-        elif self.relation == self.RELATION_NOT_EQUAL:
-            return not self._resolve_equal(values)
-
-        elif self.relation == self.RELATION_CONTAINS:
-            return self._resolve_contains(values)
-
-        elif self.relation == self.RELATION_GREATER_THAN:
-            return self._resolve_greater_than(values)
-
-        elif self.relation == self.RELATION_GREATER_THAN_EQUAL:
-            return self._resolve_greater_than_equal(values)
-
-        elif self.relation == self.RELATION_LESSER_THAN:
-            return self._resolve_lesser_than(values)
+    def resolve(self, project, snapshot=None, values=None):
+        # get the values for the given project, the given snapshot and the condition's attribute,
+        # unless they were already fetched by the caller (e.g. for the batched resolve in the api)
+        if values is None:
+            values = project.values.filter(snapshot=snapshot).filter(attribute=self.source)
 
-        elif self.relation == self.RELATION_LESSER_THAN_EQUAL:
-            return self._resolve_lesser_than_equal(values)
+        return self.predicate(values)
 
-        elif self.relation == self.RELATION_EMPTY:
-            return not self._resolve_not_empty(values)
-
-        elif self.relation == self.RELATION_NOT_EMPTY:
-            return self._resolve_not_empty(values)
-
-        else:
-            return False
-
-    def _resolve_equal(self, values):
-        results = []
-
-        for value in values:
-            if self.target_option:
-                results.append(value.option == self.target_option)
+    @property
+    def predicate(self):
+        # the compiled predicate is cached per process, the cache key contains the fields
+        # used for the compilation, so that changes in other processes are not missed
+        key = (self.relation, self.target_text, self.target_option_id)
+
+        try:
+            cached_key, predicate = predicates[self.pk]
+            if cached_key == key:
+                return predicate
+        except KeyError:
+            pass
+
+        predicate = self.compile()
+        if self.pk is not None:
+            predicates[self.pk] = (key, predicate)
+
+        return predicate
+
+    def compile(self):
+        # compile the relation and the target of this condition into a function,
+        # which takes a list of values and returns the result of the condition
+        if self.relation in (self.RELATION_EQUAL, self.RELATION_NOT_EQUAL):
+            if self.target_option_id:
+                target_option_id = self.target_option_id
+                predicate = self._compile_any(lambda value: value.option_id == target_option_id)
             else:
-                results.append(value.text == self.target_text)
-
-        return True in results
-
-    def _resolve_contains(self, values):
-        results = []
+                target_text = self.target_text
+                predicate = self._compile_any(lambda value: value.text == target_text)
 
-        for value in values:
-            results.append(self.target_text in value.text)
-
-        return True in results
-
-    def _resolve_greater_than(self, values):
-
-        for value in values:
-            try:
-                if float(value.text) > float(self.target_text):
-                    return True
-            except ValueError:
-                pass
-
-        return False
-
-    def _resolve_greater_than_equal(self, values):
-
-        for value in values:
-            try:
-                if float(value.text) >= float(self.target_text):
-                    return True
-            except ValueError:
-                pass
-
-        return False
+            if self.relation == self.RELATION_NOT_EQUAL:
+                return self._compile_not(predicate)
+            else:
+                return predicate
 
-    def _resolve_lesser_than(self, values):
+        elif self.relation == self.RELATION_CONTAINS:
+            target_text = self.target_text
+            return self._compile_any(lambda value: target_text in value.text)
 
-        for value in values:
+        elif self.relation in self.NUMERIC_RELATIONS:
             try:
-                if float(value.text) < float(self.target_text):
-                    return True
+                target_number = float(self.target_text)
             except ValueError:
-                pass
+                return self._compile_false()
 
-        return False
+            relation_operator = self.NUMERIC_RELATIONS[self.relation]
 
-    def _resolve_lesser_than_equal(self, values):
+            def check(value):
+                try:
+                    return relation_operator(float(value.text), target_number)
+                except ValueError:
+                    return False
 
-        for value in values:
-            try:
-                if float(value.text) <= float(self.target_text):
-                    return True
-            except ValueError:
-                pass
+            return self._compile_any(check)
 
-        return False
+        elif self.relation in (self.RELATION_EMPTY, self.RELATION_NOT_EMPTY):
+            predicate = self._compile_any(lambda value: bool(value.text) or bool(value.option_id))
 
-    def _resolve_not_empty(self, values):
-
-        for value in values:
-            if bool(value.text) or bool(value.option):
-                return True
+            if self.relation == self.RELATION_EMPTY:
+                return self._compile_not(predicate)
+            else:
+                return predicate
 
-        return False
+        else:
+            return self._compile_false()
+
+    @staticmethod
+    def _compile_any(check):
+        def predicate(values):
+            return any(check(value) for value in values)
+        return predicate
+
+    @staticmethod
+    def _compile_not(predicate):
+        def negated_predicate(values):
+            return not predicate(values)
+        return negated_predicate
+
+    @staticmethod
+    def _compile_false():
+        def predicate(values):
+            return False
+        return predicate
 
     @classmethod
     def build_uri(cls, uri_prefix, key):
@@ -1,3 +1,7 @@
+import pytest
+
+from rdmo.projects.models import Value
+
 from ..models import Condition
 
 
@@ -23,3 +27,43 @@ def test_condition_copy(db):
         assert new_instance.key == new_key
         assert new_instance.source == instance.source
         assert new_instance.target_option == instance.target_option
+
+
+@pytest.mark.parametrize('relation,target_text,texts,result', [
+    ('eq', 'test', ['foo', 'test'], True),
+    ('eq', 'test', ['foo'], False),
+    ('neq', 'test', ['foo'], True),
+    ('neq', 'test', ['test'], False),
+    ('contains', 'es', ['foo', 'test'], True),
+    ('contains', 'es', ['foo'], False),
+    ('gt', '1', ['a', '2'], True),
+    ('gt', '1', ['1'], False),
+    ('gte', '1', ['1'], True),
+    ('lt', '1', ['0.5'], True),
+    ('lt', '1', ['1', 'a'], False),
+    ('lte', '1', ['1'], True),
+    ('gt', 'a', ['2'], False),
+    ('empty', '', [], True),
+    ('empty', '', ['foo'], False),
+    ('notempty', '', ['foo'], True),
+    ('notempty', '', [''], False),
+])
+def test_condition_predicate(relation, target_text, texts, result):
+    condition = Condition(relation=relation, target_text=target_text)
+    assert condition.predicate([Value(text=text) for text in texts]) is result
+
+
+def test_condition_predicate_option(db):
+    condition = Condition.objects.exclude(target_option=None).first()
+    assert condition.predicate([Value(option_id=condition.target_option_id)]) is True
+    assert condition.predicate([Value(text=condition.target_option.text)]) is False
+
+
+def test_condition_predicate_cache(db):
+    condition = Condition.objects.get(pk=1)
+    predicate = condition.predicate
+    assert Condition.objects.get(pk=1).predicate is predicate
+
+    condition.target_text = 'changed'
+    condition.save()
+    assert Condition.objects.get(pk=1).predicate is not predicate
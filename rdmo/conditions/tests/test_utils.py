@@ -0,0 +1,20 @@
+import pytest
+
+from rdmo.projects.models import Project
+
+from ..models import Condition
+from ..utils import ConditionResolver
+
+projects = [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_condition_resolver(db, django_assert_num_queries, project_id):
+    project = Project.objects.get(pk=project_id)
+    conditions = list(Condition.objects.all())
+
+    resolver = ConditionResolver(project)
+    with django_assert_num_queries(1):
+        results = [resolver.resolve(condition) for condition in conditions]
+
+    assert results == [condition.resolve(project) for condition in conditions]
@@ -0,0 +1,20 @@
+from django.utils.functional import cached_property
+
+
+class ConditionResolver(object):
+    # resolves any number of conditions for a project (and snapshot), the values of
+    # the project are fetched once (on first use) and stored in an index by attribute
+
+    def __init__(self, project, snapshot=None):
+        self.project = project
+        self.snapshot = snapshot
+
+    @cached_property
+    def values(self):
+        values = {}
+        for value in self.project.values.filter(snapshot=self.snapshot):
+            values.setdefault(value.attribute_id, []).append(value)
+        return values
+
+    def resolve(self, condition):
+        return condition.resolve(self.project, self.snapshot, values=self.values.get(condition.source_id, []))
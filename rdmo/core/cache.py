@@ -0,0 +1,48 @@
+import threading
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import caches
+from django.db import transaction
+
+deferred = threading.local()
+
+
+def get_version(cache_key):
+    # a version is a random token, which is replaced whenever the cached content changes,
+    # it is used as part of the keys of the cached content
+    version = caches['api'].get(cache_key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not caches['api'].add(cache_key, version, None):
+            # the version was set by a different process in the meantime
+            version = caches['api'].get(cache_key, version)
+
+    return version
+
+
+def update_version(cache_key):
+    cache_keys = getattr(deferred, 'cache_keys', None)
+    if cache_keys is None:
+        # the version is only replaced when the changes are committed, otherwise a different request could
+        # cache content under the new version, which is then rolled back (or still uncommitted)
+        transaction.on_commit(lambda: caches['api'].set(cache_key, uuid.uuid4().hex, None))
+    else:
+        cache_keys.add(cache_key)
+
+
+@contextmanager
+def defer_version_updates():
+    # collect the updates of the versions and perform them only once for every key at the end
+    if getattr(deferred, 'cache_keys', None) is not None:
+        # updates are already deferred by an outer block
+        yield
+        return
+
+    deferred.cache_keys = set()
+    try:
+        yield
+    finally:
+        cache_keys, deferred.cache_keys = deferred.cache_keys, None
+        for cache_key in cache_keys:
+            update_version(cache_key)
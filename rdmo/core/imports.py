@@ -1,6 +1,10 @@
 import logging
 import tempfile
+import threading
 import time
+from collections.abc import Sequence
+from contextlib import contextmanager
+from itertools import islice
 from os.path import join as pj
 from random import randint
 
@@ -9,6 +13,11 @@ from rdmo.core.utils import get_languages
 
 logger = logging.getLogger(__name__)
 
+prefetched = threading.local()
+
+# marks an uri which is used by more than one instance
+DUPLICATE = object()
+
 
 def handle_uploaded_file(filedata):
     tempfilename = generate_tempfile_name()
@@ -45,10 +54,105 @@ def set_lang_field(instance, field_name, element):
             setattr(instance, '%s_%s' % (field_name, lang_field), field)
 
 
+@contextmanager
+def prefetch_instances():
+    # during an import, the existing instances of every model are fetched only once (on first use)
+    # and stored by uri, so that all lookups by uri are done in memory
+    if getattr(prefetched, 'instances', None) is not None:
+        # instances are already prefetched by an outer block
+        yield
+        return
+
+    prefetched.instances, prefetched.uris, prefetched.parents = {}, {}, {}
+    try:
+        yield
+    finally:
+        prefetched.instances, prefetched.uris, prefetched.parents = None, None, None
+
+
+def get_prefetched_instances(model):
+    instances = getattr(prefetched, 'instances', None)
+    if instances is None:
+        return None
+
+    if model not in instances:
+        instances[model], prefetched.uris[model] = {}, {}
+        for instance in model.objects.all():
+            # uris which are used by more than one instance are marked, so that
+            # they are looked up in the database like before (see get_instance)
+            uri = instance.uri
+            instances[model][uri] = DUPLICATE if uri in instances[model] else instance
+            prefetched.uris[model][instance.pk] = uri
+
+    return instances[model]
+
+
+def add_prefetched_instance(instance):
+    # store an instance after it was saved, so that it can be used by the following elements
+    instances = getattr(prefetched, 'instances', None)
+    model = type(instance)
+    if instances is None or model not in instances:
+        return
+
+    uri = prefetched.uris[model].get(instance.pk)
+    if uri is not None and uri != instance.uri:
+        # the uri of an existing instance has changed, which can also change the uris
+        # of other instances in the database, therefore all instances are fetched again
+        instances.clear()
+        prefetched.uris.clear()
+    else:
+        if instances[model].get(instance.uri) is not DUPLICATE:
+            instances[model][instance.uri] = instance
+        prefetched.uris[model][instance.pk] = instance.uri
+
+
+def copy_instance(instance):
+    # the import functions change the instances they get, also if they are not saved afterwards
+    # (e.g. for the preview), therefore only copies of the prefetched instances are returned
+    fields = instance._meta.concrete_fields
+    return type(instance).from_db(instance._state.db, [field.attname for field in fields],
+                                  [getattr(instance, field.attname) for field in fields])
+
+
+def get_instance(model, uri, parent_field=None, parent_uri=None):
+    # works like model.objects.get(uri=uri, <parent_field>__uri=parent_uri),
+    # but uses the prefetched instances during an import
+    lookup = {'uri': uri}
+    if parent_field is not None:
+        lookup[parent_field + '__uri'] = parent_uri
+
+    model_instances = get_prefetched_instances(model)
+    if model_instances is None:
+        return model.objects.get(**lookup)
+
+    instance = model_instances.get(uri)
+    if instance is not None and parent_field is not None:
+        if parent_uri:
+            parent_model = model._meta.get_field(parent_field).related_model
+            parent = get_prefetched_instances(parent_model).get(parent_uri)
+            if parent is DUPLICATE:
+                return model.objects.get(**lookup)
+
+            parent_id = parent.pk if parent else False
+        else:
+            parent_id = None
+
+        if instance is not DUPLICATE and getattr(instance, parent_field + '_id') != parent_id:
+            instance = None
+
+    if instance is None:
+        raise model.DoesNotExist
+    elif instance is DUPLICATE:
+        # raises MultipleObjectsReturned, unless the parent lookup finds only one instance
+        return model.objects.get(**lookup)
+
+    return copy_instance(instance)
+
+
 def get_foreign_field(instance, foreign_uri, foreign_model):
     if foreign_uri:
         try:
-            return foreign_model.objects.get(uri=foreign_uri)
+            return get_instance(foreign_model, foreign_uri)
         except foreign_model.DoesNotExist:
             logger.info('{foreign_model} {foreign_uri} for {instance_model} {instance_uri} does not exist.'.format(
                 foreign_model=foreign_model._meta.object_name,
@@ -71,7 +175,7 @@ def get_m2m_instances(instance, foreign_uris, foreign_model):
     if foreign_uris:
         for foreign_uri in foreign_uris:
             try:
-                foreign_instance = foreign_model.objects.get(uri=foreign_uri)
+                foreign_instance = get_instance(foreign_model, foreign_uri)
                 foreign_instances.append(foreign_instance)
             except foreign_model.DoesNotExist:
                 logger.info('{foreign_model} {foreign_uri} for imported {instance_model} {instance_uri} does not exist.'.format(
@@ -117,7 +221,69 @@ def validate_instance(instance, *validators):
             instance.errors.append(message)
 
 
+class ParentUris(Sequence):
+    # a read-only view on the first uris of a list, which is shared
+    # with the parents of the following elements of the import
+
+    def __init__(self, uris, positions, length):
+        self.uris = uris
+        self.positions = positions
+        self.length = length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.uris[:self.length][index]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('parent index out of range')
+
+        return self.uris[index]
+
+    def __iter__(self):
+        return islice(self.uris, self.length)
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, uri):
+        return self.positions.get(uri, self.length) < self.length
+
+
+class PrefetchedParents(object):
+    # the uris of the possible parents of one model, the existing uris are fetched once and the uris
+    # of the imported instances are appended, so that every element only sees the preceding ones
+
+    def __init__(self, model, instances):
+        self.model = model
+        self.instances = instances
+        self.count = 0
+        self.uris = []
+        self.positions = {}
+        self.add_uris(sorted(model.objects.values_list('uri', flat=True)))
+
+    def add_uris(self, uris):
+        for uri in uris:
+            if uri not in self.positions:
+                self.positions[uri] = len(self.uris)
+                self.uris.append(uri)
+
+    def fetch(self, instances):
+        # only the instances which were appended since the last call are scanned
+        self.add_uris(instance.uri for instance in instances[self.count:] if isinstance(instance, self.model))
+        self.count = len(instances)
+        return ParentUris(self.uris, self.positions, len(self.uris))
+
+
 def fetch_parents(model, instances):
-    parents = list(model.objects.values_list('uri', flat=True))
-    parents += [instance.uri for instance in instances if isinstance(instance, model)]
-    return set(sorted(parents))
+    parents = getattr(prefetched, 'parents', None)
+    if parents is None:
+        uris = list(model.objects.values_list('uri', flat=True))
+        uris += [instance.uri for instance in instances if isinstance(instance, model)]
+        return set(sorted(uris))
+
+    if model not in parents or parents[model].instances is not instances:
+        parents[model] = PrefetchedParents(model, instances)
+
+    return parents[model].fetch(instances)
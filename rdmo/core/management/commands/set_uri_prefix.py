@@ -1,53 +1,61 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import models, transaction
+from django.db.models.functions import Concat
 
 from rdmo.conditions.models import Condition
-from rdmo.options.models import OptionSet, Option
+from rdmo.core.utils import join_url
 from rdmo.domain.models import Attribute
-from rdmo.questions.models import Catalog, Section, Subsection, QuestionSet, Question
+from rdmo.options.models import Option, OptionSet
+from rdmo.questions.models import Catalog, Question, QuestionSet, Section
+from rdmo.questions.utils import update_catalog_versions
 from rdmo.tasks.models import Task
 from rdmo.views.models import View
 
+# the models, the path segment of their uris and the field which is appended to it, see build_uri
+ELEMENTS = (
+    (Condition, '/conditions/', 'key'),
+    (OptionSet, '/options/', 'key'),
+    (Option, '/options/', 'path'),
+    (Attribute, '/domain/', 'path'),
+    (Catalog, '/questions/', 'key'),
+    (Section, '/questions/', 'path'),
+    (QuestionSet, '/questions/', 'path'),
+    (Question, '/questions/', 'path'),
+    (Task, '/tasks/', 'key'),
+    (View, '/views/', 'key')
+)
+
 
 class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument('uri_prefix', action='store', help='URI prefix to be used for all elements.')
+        parser.add_argument('--dry-run', action='store_true', default=False,
+                            help='Only report the number of elements which would be changed.')
 
+    @transaction.atomic
     def handle(self, *args, **options):
-
-        for obj in Condition.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in OptionSet.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Option.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Attribute.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Catalog.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Section.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Subsection.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in QuestionSet.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Question.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in Task.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-        for obj in View.objects.all():
-            self._set_uri_prefix(obj, options['uri_prefix'])
-
-    def _set_uri_prefix(self, obj, uri_prefix):
-        obj.uri_prefix = uri_prefix
-        obj.save()
+        uri_prefix = options['uri_prefix']
+
+        count = 0
+        for model, segment, field_name in ELEMENTS:
+            # the uri is computed by the database, since the path (or key) of the elements does not change
+            uri = Concat(models.Value(join_url(uri_prefix or settings.DEFAULT_URI_PREFIX, segment)),
+                         models.F(field_name), output_field=models.URLField())
+
+            queryset = model.objects.exclude(uri_prefix=uri_prefix, uri=uri)
+            if options['dry_run']:
+                model_count = queryset.count()
+            else:
+                model_count = queryset.update(uri_prefix=uri_prefix, uri=uri)
+
+            self.stdout.write('%s: %i' % (model._meta.verbose_name_plural, model_count))
+            count += model_count
+
+        if options['dry_run']:
+            self.stdout.write('%i elements would be changed.' % count)
+        else:
+            # the post_save signals are not sent for update(), therefore all cached catalogs are invalidated here
+            update_catalog_versions()
+            self.stdout.write('%i elements changed.' % count)
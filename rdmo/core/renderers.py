@@ -5,6 +5,33 @@ from django.utils.encoding import smart_text
 from rest_framework.renderers import BaseRenderer
 
 
+class IndentedXMLGenerator(SimplerXMLGenerator):
+    # writes every element on a new line, indented by its depth, while the
+    # document is generated, elements without children are kept on one line
+
+    def __init__(self, out=None, encoding='utf-8', indent='\t'):
+        super().__init__(out, encoding, short_empty_elements=True)
+        self._indent = indent
+        self._has_children = []
+
+    def startElement(self, name, attrs):
+        self._finish_pending_start_element()
+        if self._has_children:
+            self._has_children[-1] = True
+            self._write('\n' + self._indent * len(self._has_children))
+        self._has_children.append(False)
+        super().startElement(name, attrs)
+
+    def endElement(self, name):
+        if self._has_children.pop():
+            self._write('\n' + self._indent * len(self._has_children))
+        super().endElement(name)
+
+    def endDocument(self):
+        self._write('\n')
+        super().endDocument()
+
+
 class BaseXMLRenderer(BaseRenderer):
 
     media_type = 'application/xml'
@@ -174,6 +174,7 @@ REST_FRAMEWORK = {
 }
 
 REST_FRAMEWORK_EXTENSIONS = {
+    'DEFAULT_USE_CACHE': 'api',
     'DEFAULT_CACHE_RESPONSE_TIMEOUT': 60
 }
 
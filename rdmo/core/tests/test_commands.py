@@ -0,0 +1,47 @@
+import io
+
+from django.core.management import call_command
+
+from rdmo.domain.models import Attribute
+from rdmo.options.models import Option
+from rdmo.questions.models import Catalog, Question
+
+from ..management.commands.set_uri_prefix import ELEMENTS
+
+uri_prefix = 'https://example.org/terms'
+
+
+def test_set_uri_prefix(db, django_assert_max_num_queries):
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    with django_assert_max_num_queries(len(ELEMENTS) + 2):
+        call_command('set_uri_prefix', uri_prefix, stdout=stdout, stderr=stderr)
+
+    count = sum(model.objects.count() for model, segment, field_name in ELEMENTS)
+    assert stdout.getvalue().endswith('%i elements changed.\n' % count)
+    assert not stderr.getvalue()
+
+    # the uris are the same as if the elements were saved
+    for model in [Attribute, Option, Catalog, Question]:
+        for instance in model.objects.all():
+            assert instance.uri_prefix == uri_prefix
+            assert instance.uri.startswith(uri_prefix + '/')
+            uri = instance.uri
+            instance.save()
+            assert instance.uri == uri
+
+    # nothing is changed the second time
+    stdout = io.StringIO()
+    call_command('set_uri_prefix', uri_prefix, stdout=stdout)
+    assert stdout.getvalue().endswith('0 elements changed.\n')
+
+
+def test_set_uri_prefix_dry_run(db):
+    uris = list(Question.objects.values_list('uri', flat=True))
+    stdout = io.StringIO()
+
+    call_command('set_uri_prefix', uri_prefix, '--dry-run', stdout=stdout)
+
+    count = sum(model.objects.count() for model, segment, field_name in ELEMENTS)
+    assert stdout.getvalue().endswith('%i elements would be changed.\n' % count)
+    assert list(Question.objects.values_list('uri', flat=True)) == uris
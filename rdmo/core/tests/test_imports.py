@@ -0,0 +1,104 @@
+import pytest
+
+from rdmo.domain.models import Attribute
+from rdmo.options.models import Option, OptionSet
+
+from ..imports import (add_prefetched_instance, fetch_parents, get_instance,
+                       prefetch_instances)
+
+
+def test_get_instance(db):
+    option = Option.objects.first()
+
+    assert get_instance(Option, option.uri) == option
+    assert get_instance(Option, option.uri, 'optionset', option.optionset.uri) == option
+
+    with pytest.raises(Option.DoesNotExist):
+        get_instance(Option, option.uri, 'optionset', 'http://example.com/missing')
+
+
+def test_get_instance_prefetched(db, django_assert_num_queries):
+    options = list(Option.objects.select_related('optionset'))
+
+    with prefetch_instances():
+        get_instance(Option, options[0].uri, 'optionset', options[0].optionset.uri)
+
+        with django_assert_num_queries(0):
+            for option in options:
+                assert get_instance(Option, option.uri) == option
+                assert get_instance(Option, option.uri, 'optionset', option.optionset.uri) == option
+
+                with pytest.raises(Option.DoesNotExist):
+                    get_instance(Option, option.uri, 'optionset', 'http://example.com/missing')
+
+                with pytest.raises(Option.DoesNotExist):
+                    get_instance(Option, option.uri, 'optionset', None)
+
+            with pytest.raises(Option.DoesNotExist):
+                get_instance(Option, 'http://example.com/missing')
+
+
+def test_add_prefetched_instance(db):
+    with prefetch_instances():
+        optionset = OptionSet(uri_prefix='http://example.com/terms', key='new')
+        optionset.save()
+        add_prefetched_instance(optionset)
+
+        assert get_instance(OptionSet, optionset.uri) == optionset
+
+
+def test_add_prefetched_instance_uri_changed(db):
+    attribute = Attribute.objects.exclude(children=None).first()
+    child = attribute.children.first()
+
+    with prefetch_instances():
+        get_instance(Attribute, child.uri)
+
+        attribute.key = 'changed'
+        attribute.save()
+        add_prefetched_instance(attribute)
+
+        child.refresh_from_db()
+        assert get_instance(Attribute, child.uri) == child
+
+
+def test_fetch_parents_prefetched(db, django_assert_num_queries):
+    uris = set(OptionSet.objects.values_list('uri', flat=True))
+    optionsets = [OptionSet(uri='http://example.com/terms/options/new%d' % i) for i in range(3)]
+
+    with prefetch_instances():
+        instances = []
+        parents = [fetch_parents(OptionSet, instances)]
+
+        with django_assert_num_queries(0):
+            for optionset in optionsets:
+                instances.append(optionset)
+                parents.append(fetch_parents(OptionSet, instances))
+
+    # every element only gets the existing and the preceding parents
+    for i, element_parents in enumerate(parents):
+        expected = uris | {optionset.uri for optionset in optionsets[:i]}
+        assert set(element_parents) == expected
+        assert len(element_parents) == len(expected)
+        assert all(uri in element_parents for uri in expected)
+        assert all(optionset.uri not in element_parents for optionset in optionsets[i:])
+
+
+def test_get_instance_prefetched_copy(db):
+    optionset = OptionSet.objects.exclude(options=None).first()
+
+    with prefetch_instances():
+        # changes of an instance which is not saved do not affect the following lookups
+        instance = get_instance(OptionSet, optionset.uri)
+        instance.key = 'changed'
+
+        assert get_instance(OptionSet, optionset.uri).key == optionset.key
+
+
+def test_get_instance_prefetched_duplicate(db):
+    optionsets = OptionSet.objects.all()[:2]
+    OptionSet.objects.filter(pk=optionsets[1].pk).update(uri=optionsets[0].uri)
+
+    with prefetch_instances():
+        with pytest.raises(OptionSet.MultipleObjectsReturned):
+            get_instance(OptionSet, optionsets[0].uri)
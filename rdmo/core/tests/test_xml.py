@@ -1,3 +1,47 @@
+import os
+
+import defusedxml.ElementTree as ET
+import pytest
+
+from ..xml import (flat_xml_to_elements, get_ns_map, get_uri,
+                   parse_xml_string, read_xml_file)
+
+ns_map = {'dc': 'http://purl.org/dc/elements/1.1/'}
+
+
+@pytest.mark.parametrize('file_name', ['conditions', 'domain', 'options', 'project', 'questions', 'tasks', 'views'])
+def test_get_ns_map(settings, file_name):
+    root = read_xml_file(os.path.join(settings.BASE_DIR, 'xml', '%s.xml' % file_name))
+
+    assert get_ns_map(root) == ns_map
+
+
+def test_get_ns_map_string(settings):
+    with open(os.path.join(settings.BASE_DIR, 'xml', 'domain.xml'), encoding='utf8') as f:
+        string = f.read()
+
+    root = parse_xml_string(string)
+    assert get_ns_map(root) == ns_map
+    assert flat_xml_to_elements(root) == flat_xml_to_elements(ET.fromstring(string))
+
+
+def test_get_ns_map_not_parsed(settings):
+    root = ET.parse(os.path.join(settings.BASE_DIR, 'xml', 'domain.xml')).getroot()
+
+    assert get_ns_map(root) == ns_map
+
+
+def test_get_ns_map_prefix(settings):
+    with open(os.path.join(settings.BASE_DIR, 'xml', 'domain.xml'), encoding='utf8') as f:
+        string = f.read()
+
+    # the dc namespace is declared with a different prefix
+    root = parse_xml_string(string.replace('xmlns:dc=', 'xmlns:d=').replace('dc:', 'd:'))
+    assert get_ns_map(root)['dc'] == ns_map['dc']
+    assert get_uri(root[0], get_ns_map(root)) == get_uri(ET.fromstring(string)[0], ns_map)
+    assert flat_xml_to_elements(root) == flat_xml_to_elements(ET.fromstring(string))
+
+
 # import os
 # import xml.etree.ElementTree as ET
 
@@ -1,5 +1,6 @@
 from defusedcsv import csv
 import importlib
+import io
 import logging
 import os
 import re
@@ -10,7 +11,8 @@ from urllib.parse import urlparse
 import pypandoc
 from django.apps import apps
 from django.conf import settings
-from django.http import Http404, HttpResponse, HttpResponseBadRequest
+from django.http import (Http404, HttpResponse, HttpResponseBadRequest,
+                         StreamingHttpResponse)
 from django.template.loader import get_template
 from django.utils.translation import ugettext_lazy as _
 
@@ -226,6 +228,24 @@ def render_to_csv(title, rows, delimiter=','):
     return response
 
 
+def render_to_streaming_csv(title, rows, delimiter=','):
+    def stream():
+        # every row is written to a small buffer, which is emptied after it was sent
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter)
+        for row in rows:
+            writer.writerow(
+                ['' if x is None else str(x) for x in row]
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    response = StreamingHttpResponse(stream(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="%s.csv"' % title
+    return response
+
+
 def return_file_response(file_path, content_type):
     file_abspath = Path(settings.MEDIA_ROOT) / file_path
     if file_abspath.exists():
@@ -273,6 +293,30 @@ def copy_model(instance, **kwargs):
     return instance_copy
 
 
+def update_uris(instances, parents):
+    # recompute the path and the uri of the instances in memory, using the given (already updated)
+    # parents by pk, and write the changed instances with one bulk_update, the returned instances
+    # by pk can be used as parents for the next level of the hierarchy
+    instances = list(instances)
+
+    changed = []
+    for instance in instances:
+        parent_field = instance.parent_field
+        parent = parents[getattr(instance, parent_field + '_id')]
+        setattr(instance, parent_field, parent)
+
+        path = instance.build_path(instance.key, parent)
+        uri = instance.build_uri(instance.uri_prefix, path)
+        if instance.path != path or instance.uri != uri:
+            instance.path, instance.uri = path, uri
+            changed.append(instance)
+
+    if changed:
+        instance._meta.model.objects.bulk_update(changed, ['path', 'uri'])
+
+    return {instance.pk: instance for instance in instances}
+
+
 def human2bytes(string):
     if not string:
         return 0
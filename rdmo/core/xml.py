@@ -1,25 +1,51 @@
+import io
 import logging
 import re
+import weakref
 
 import defusedxml.ElementTree as ET
 
 log = logging.getLogger(__name__)
 
+# the namespace maps of the parsed trees by root node, since they are not part of the tree itself
+ns_maps = weakref.WeakKeyDictionary()
+
+# the namespaces which are always available by these prefixes, regardless of the prefix used in the file
+known_namespaces = {
+    'dc': 'http://purl.org/dc/elements/1.1/'
+}
+
 
 def read_xml_file(file_name):
     try:
-        return ET.parse(file_name).getroot()
+        return parse_xml(file_name)
     except Exception as e:
         log.error('Xml parsing error: ' + str(e))
 
 
 def parse_xml_string(string):
     try:
-        return ET.fromstring(string)
+        return parse_xml(io.StringIO(string) if isinstance(string, str) else io.BytesIO(string))
     except Exception as e:
         log.error('Xml parsing error: ' + str(e))
 
 
+def parse_xml(source):
+    # parse the xml and collect the declared namespaces on the way, see get_ns_map
+    ns_map = {}
+    iterator = ET.iterparse(source, events=('start-ns', ))
+    for event, (prefix, uri) in iterator:
+        if prefix:
+            ns_map[prefix] = uri
+
+    for prefix, uri in known_namespaces.items():
+        if uri in ns_map.values():
+            ns_map[prefix] = uri
+
+    ns_maps[iterator.root] = ns_map
+    return iterator.root
+
+
 def flat_xml_to_elements(treenode):
     elements = []
     ns_map = get_ns_map(treenode)
@@ -59,6 +85,11 @@ def get_ns_tag(tag, ns_map):
 
 
 def get_ns_map(treenode):
+    ns_map = ns_maps.get(treenode)
+    if ns_map is not None:
+        return ns_map
+
+    # the tree was not parsed by parse_xml, therefore the namespaces are taken from the serialized tree
     ns_map = {}
     treestring = ET.tostring(treenode, encoding='utf8', method='xml')
 
@@ -1,6 +1,6 @@
 import logging
 
-from rdmo.core.imports import (fetch_parents, get_foreign_field,
+from rdmo.core.imports import (fetch_parents, get_foreign_field, get_instance,
                                set_common_fields, validate_instance)
 
 from .models import Attribute
@@ -15,7 +15,7 @@ def import_attribute(element, parent_uri=False, save=False):
         parent_uri = element.get('parent')
 
     try:
-        attribute = Attribute.objects.get(uri=element.get('uri'), parent__uri=parent_uri)
+        attribute = get_instance(Attribute, element.get('uri'), 'parent', parent_uri)
     except Attribute.DoesNotExist:
         attribute = Attribute()
 
@@ -3,7 +3,7 @@ from django.db import models
 from django.utils.translation import ugettext_lazy as _
 from mptt.models import MPTTModel, TreeForeignKey
 
-from rdmo.core.utils import copy_model, join_url
+from rdmo.core.utils import copy_model, join_url, update_uris
 
 
 class Attribute(MPTTModel):
@@ -58,9 +58,11 @@ class Attribute(MPTTModel):
         self.uri = self.build_uri(self.uri_prefix, self.path)
         super().save(*args, **kwargs)
 
-        # recursively save children
-        for child in self.children.all():
-            child.save()
+        # update the paths and uris of all descendants with one bulk_update for each level
+        # (the mptt fields cannot be used, since they are not rebuilt during a copy)
+        parents = {self.pk: self}
+        while parents:
+            parents = update_uris(Attribute.objects.filter(parent__in=parents), parents)
 
     def copy(self, uri_prefix, key, parent=None, rebuild=True):
         assert parent not in self.get_descendants(include_self=True)
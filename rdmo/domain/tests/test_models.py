@@ -23,3 +23,18 @@ def test_attribute_copy(db):
         assert new_instance.key == new_key
         assert new_instance.parent == instance.parent
         assert new_instance.get_descendants().count() == new_instance.get_descendants().count()
+
+
+def test_attribute_save_key(db, django_assert_max_num_queries):
+    attribute = Attribute.objects.get(path='individual')
+    attribute.key = 'changed'
+
+    with django_assert_max_num_queries(10):
+        attribute.save()
+
+    descendants = attribute.get_descendants()
+    assert descendants.exists()
+    for descendant in descendants:
+        assert descendant.path == Attribute.build_path(descendant.key, descendant.parent)
+        assert descendant.uri == Attribute.build_uri(descendant.uri_prefix, descendant.path)
+        assert descendant.path.startswith('changed/')
@@ -1,5 +1,8 @@
+from django.db import transaction
+
 from rdmo.conditions.imports import import_condition
 from rdmo.core.constants import PERMISSIONS
+from rdmo.core.imports import add_prefetched_instance, prefetch_instances
 from rdmo.domain.imports import fetch_attribute_parents, import_attribute
 from rdmo.options.imports import (fetch_option_parents, import_option,
                                   import_optionset)
@@ -8,6 +11,7 @@ from rdmo.questions.imports import (fetch_question_parents,
                                     fetch_section_parents, import_catalog,
                                     import_question, import_questionset,
                                     import_section)
+from rdmo.questions.utils import defer_catalog_version_updates
 from rdmo.tasks.imports import import_task
 from rdmo.views.imports import import_view
 
@@ -22,8 +26,14 @@ def check_permissions(elements, user):
     return user.has_perms(permissions)
 
 
+@defer_catalog_version_updates()
+@prefetch_instances()
+@transaction.atomic
 def import_elements(elements, parents={}, save={}):
+    # the elements are imported in one transaction, the existing instances are fetched once for
+    # each model and the versions of the affected catalogs are updated only once at the end
     instances = []
+    instance_uris = set()
 
     for element in elements:
         element_type = element.get('type')
@@ -67,6 +77,9 @@ def import_elements(elements, parents={}, save={}):
 
         # step 2: fetch available parents
         if instance:
+            if getattr(instance, 'imported', False):
+                add_prefetched_instance(instance)
+
             if not save:
                 if element_type == 'attribute':
                     instance.parents = fetch_attribute_parents(instances)
@@ -85,10 +98,11 @@ def import_elements(elements, parents={}, save={}):
 
                 # check if a missing element was already imported
                 for uri in instance.missing:
-                    if uri in [instance.uri for instance in instances]:
+                    if uri in instance_uris:
                         instance.missing[uri]['in_file'] = True
 
             # append the instance to the list of instances
             instances.append(instance)
+            instance_uris.add(instance.uri)
 
     return instances
@@ -1,9 +1,10 @@
 import os
 
-from rdmo.core.xml import flat_xml_to_elements, read_xml_file
+from rdmo.core.xml import (filter_elements_by_type, flat_xml_to_elements,
+                           read_xml_file)
 from rdmo.domain.models import Attribute
 from rdmo.management.imports import import_elements
-from rdmo.options.models import Option
+from rdmo.options.models import Option, OptionSet
 
 
 def test_non_unique_path(db, settings):
@@ -58,3 +59,22 @@ def test_missing_parent(db, settings):
 
     # no option has been imported
     assert Option.objects.count() == count
+
+
+def test_parent_not_saved(db, settings):
+    xml_file = os.path.join(settings.BASE_DIR, 'xml', 'options.xml')
+    root = read_xml_file(xml_file)
+    elements = flat_xml_to_elements(root)
+
+    # the key of the option set is changed in the file, but only the options are saved
+    element = next(filter_elements_by_type(elements, 'optionset'))
+    element['key'] = 'changed'
+    optionset = OptionSet.objects.get(uri=element.get('uri'))
+
+    checked = {element.get('uri'): True for element in filter_elements_by_type(elements, 'option')}
+    instances = import_elements(elements, parents={}, save=checked)
+
+    assert OptionSet.objects.get(pk=optionset.pk).key == optionset.key
+    assert [instance for instance in instances if getattr(instance, 'imported', False)]
+    for option in Option.objects.filter(optionset=optionset):
+        assert option.path == Option.build_path(option.key, optionset)
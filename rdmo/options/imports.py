@@ -1,7 +1,7 @@
 import logging
 
 from rdmo.conditions.models import Condition
-from rdmo.core.imports import (fetch_parents, get_foreign_field,
+from rdmo.core.imports import (fetch_parents, get_foreign_field, get_instance,
                                get_m2m_instances, set_common_fields,
                                set_lang_field, validate_instance)
 
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 def import_optionset(element, save=False):
     try:
-        optionset = OptionSet.objects.get(uri=element.get('uri'))
+        optionset = get_instance(OptionSet, element.get('uri'))
     except OptionSet.DoesNotExist:
         optionset = OptionSet()
 
@@ -43,7 +43,7 @@ def import_option(element, parent_uri=False, save=False):
         parent_uri = element.get('optionset')
 
     try:
-        option = Option.objects.get(uri=element.get('uri'), optionset__uri=parent_uri)
+        option = get_instance(Option, element.get('uri'), 'optionset', parent_uri)
     except Option.DoesNotExist:
         option = Option()
 
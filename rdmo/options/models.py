@@ -5,7 +5,7 @@ from django.utils.translation import ugettext_lazy as _
 from rdmo.conditions.models import Condition
 from rdmo.core.models import TranslationMixin
 from rdmo.core.plugins import get_plugin
-from rdmo.core.utils import copy_model, join_url
+from rdmo.core.utils import copy_model, join_url, update_uris
 
 
 class OptionSet(models.Model):
@@ -63,8 +63,8 @@ class OptionSet(models.Model):
         self.uri = self.build_uri(self.uri_prefix, self.key)
         super().save(*args, **kwargs)
 
-        for option in self.options.all():
-            option.save()
+        # update the paths and uris of all options with one bulk_update
+        update_uris(self.options.all(), {self.pk: self})
 
     def copy(self, uri_prefix, key):
         optionset = copy_model(self, uri_prefix=uri_prefix, key=key)
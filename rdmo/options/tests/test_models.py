@@ -31,6 +31,18 @@ def test_optionset_copy(db):
         assert new_instance.options.count() == instance.options.count()
 
 
+def test_optionset_save_key(db, django_assert_max_num_queries):
+    optionset = OptionSet.objects.exclude(options=None).first()
+    optionset.key = 'changed'
+
+    with django_assert_max_num_queries(5):
+        optionset.save()
+
+    for option in optionset.options.all():
+        assert option.path == 'changed/' + option.key
+        assert option.uri == Option.build_uri(option.uri_prefix, option.path)
+
+
 def test_options_clean(db):
     instances = Option.objects.all()
     for instance in instances:
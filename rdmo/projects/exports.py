@@ -1,10 +1,10 @@
 import re
+from itertools import chain
 
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
-from rdmo.core.exports import prettify_xml
 from rdmo.core.plugins import Plugin
-from rdmo.core.utils import render_to_csv
+from rdmo.core.utils import render_to_streaming_csv
 from rdmo.questions.models import Question
 
 from .renderers import XMLRenderer
@@ -19,14 +19,42 @@ class Export(Plugin):
         self.project = None
         self.snapshot = None
 
+        self._values_index = None
+        self._values_index_key = None
+
     def render(self):
         raise NotImplementedError
 
+    def get_values_index(self):
+        # all values of the project (or the snapshot) are fetched with the first call and
+        # stored by attribute path and set index, the index is rebuilt if the project
+        # or the snapshot of the export are changed
+        key = (self.project, self.snapshot)
+        if self._values_index_key != key:
+            self._values_index = {}
+            self._values_index_key = key
+
+            queryset = self.project.values.filter(snapshot=self.snapshot).select_related('attribute', 'option')
+            for value in queryset:
+                if value.attribute is not None:
+                    self._values_index.setdefault(value.attribute.path, {}) \
+                                      .setdefault(value.set_index, []).append(value)
+
+        return self._values_index
+
     def get_set(self, path):
-        return self.project.values.filter(snapshot=self.snapshot).filter(attribute__path=path)
+        # the values are returned as a list from the index, use get_queryset to filter them further
+        return list(chain.from_iterable(self.get_values_index().get(path, {}).values()))
 
     def get_values(self, path, set_index=0):
-        return self.project.values.filter(snapshot=self.snapshot).filter(attribute__path=path, set_index=set_index)
+        return list(self.get_values_index().get(path, {}).get(set_index, []))
+
+    def get_queryset(self, path, set_index=None):
+        # a regular queryset (which is not using the index) for plugins which need to chain querysets
+        queryset = self.project.values.filter(snapshot=self.snapshot).filter(attribute__path=path)
+        if set_index is not None:
+            queryset = queryset.filter(set_index=set_index)
+        return queryset
 
     def get_value(self, path, set_index=0, collection_index=0):
         try:
@@ -77,22 +105,32 @@ class CSVExport(Export):
     delimiter = ','
 
     def render(self):
-        queryset = self.project.values.filter(snapshot=None)
-        data = []
+        return render_to_streaming_csv(self.project.title, self.get_rows(), self.delimiter)
+
+    def get_rows(self):
+        # all values of the project are fetched at once and grouped by attribute and set index
+        values = {}
+        queryset = self.project.values.filter(snapshot=None) \
+                                      .select_related('attribute', 'option') \
+                                      .order_by('set_index', 'collection_index')
+        for value in queryset:
+            attribute_uri = value.attribute.uri if value.attribute else None
+            values.setdefault(attribute_uri, {}).setdefault(value.set_index, []).append(value)
+
+        questions = Question.objects.order_by_catalog(self.project.catalog) \
+                                    .select_related('attribute', 'questionset__attribute')
+        for question in questions:
+            attribute_values = values.get(question.attribute.uri if question.attribute else None, {})
 
-        for question in Question.objects.order_by_catalog(self.project.catalog):
             if question.questionset.is_collection:
                 set_attribute_uri = question.questionset.attribute.uri.rstrip('/') + '/id'
-                for value_set in queryset.filter(attribute__uri=set_attribute_uri):
-                    values = queryset.filter(attribute=question.attribute, set_index=value_set.set_index) \
-                                     .order_by('set_index', 'collection_index')
-                    data.append((self.stringify(question.text), self.stringify(value_set.value), self.stringify_values(values)))
+                for value_sets in values.get(set_attribute_uri, {}).values():
+                    for value_set in value_sets:
+                        yield (self.stringify(question.text), self.stringify(value_set.value),
+                               self.stringify_values(attribute_values.get(value_set.set_index, [])))
             else:
-                values = queryset.filter(attribute=question.attribute).order_by('set_index', 'collection_index')
-
-                data.append((self.stringify(question.text), '', self.stringify_values(values)))
-
-        return render_to_csv(self.project.title, data, self.delimiter)
+                yield (self.stringify(question.text), '',
+                       self.stringify_values(chain.from_iterable(attribute_values.values())))
 
     def stringify_values(self, values):
         if values is not None:
@@ -119,7 +157,6 @@ class RDMOXMLExport(Export):
 
     def render(self):
         serializer = ExportSerializer(self.project)
-        xmldata = XMLRenderer().render(serializer.data)
-        response = HttpResponse(prettify_xml(xmldata), content_type="application/xml")
+        response = StreamingHttpResponse(XMLRenderer().render_stream(serializer.data), content_type="application/xml")
         response['Content-Disposition'] = 'filename="%s.xml"' % self.project.title
         return response
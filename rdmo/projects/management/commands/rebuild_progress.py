@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from rdmo.projects.models import Project
+
+
+class Command(BaseCommand):
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_ids', nargs='*', type=int, help='Ids of the projects to rebuild (default: all).')
+
+    def handle(self, *args, **options):
+        projects = Project.objects.all()
+        if options['project_ids']:
+            projects = projects.filter(id__in=options['project_ids'])
+
+        for project in projects:
+            project.update_progress()
+
+        self.stdout.write('Progress rebuilt for %i projects.' % len(projects))
@@ -4,6 +4,7 @@ from mptt.models import TreeManager
 from mptt.querysets import TreeQuerySet
 
 from rdmo.accounts.utils import is_site_manager
+from rdmo.conditions.utils import ConditionResolver
 from rdmo.core.managers import CurrentSiteManagerMixin
 
 
@@ -19,13 +20,20 @@ class ProjectQuerySet(TreeQuerySet):
             elif is_site_manager(user):
                 return self.filter_current_site()
             else:
-                queryset = self.filter(user=user)
-                for instance in queryset:
-                    queryset |= instance.get_descendants()
-                return queryset.distinct()
+                return self.filter_member(user)
         else:
             return self.none()
 
+    def filter_member(self, user):
+        # projects where the user is a member of the project itself or of one of its ancestors,
+        # i.e. where the tree range of a membership contains the project
+        from .models import Membership
+        memberships = Membership.objects.filter(user=user,
+                                                project__tree_id=models.OuterRef('tree_id'),
+                                                project__lft__lte=models.OuterRef('lft'),
+                                                project__rght__gte=models.OuterRef('rght'))
+        return self.annotate(is_member=models.Exists(memberships)).filter(is_member=True)
+
 
 class MembershipQuerySet(models.QuerySet):
 
@@ -65,10 +73,14 @@ class IssueQuerySet(models.QuerySet):
             return self.none()
 
     def active(self):
-        # prefetch conditions and source to make Condition.resolve() work faster
-        issues = self.select_related('task') \
-                     .prefetch_related('task__conditions', 'task__conditions__source')
-        return [issue for issue in issues if issue.resolve()]
+        # prefetch conditions to make Condition.resolve() work faster
+        issues = self.select_related('task', 'project') \
+                     .prefetch_related('task__conditions')
+
+        # use one resolver per project, so that the values of each project are fetched only once
+        resolvers = {}
+        return [issue for issue in issues
+                if issue.resolve(resolvers.setdefault(issue.project_id, ConditionResolver(issue.project)))]
 
 
 class IntegrationQuerySet(models.QuerySet):
@@ -127,6 +139,10 @@ class ValueQuerySet(models.QuerySet):
         else:
             return self.none()
 
+    def exclude_empty(self):
+        return self.exclude((models.Q(text='') | models.Q(text=None)) & models.Q(option=None) &
+                            (models.Q(file='') | models.Q(file=None)))
+
 
 class ProjectManager(CurrentSiteManagerMixin, TreeManager):
 
@@ -136,6 +152,9 @@ class ProjectManager(CurrentSiteManagerMixin, TreeManager):
     def filter_user(self, user):
         return self.get_queryset().filter_user(user)
 
+    def filter_member(self, user):
+        return self.get_queryset().filter_member(user)
+
 
 class MembershipManager(CurrentSiteManagerMixin, models.Manager):
 
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.18 on 2021-03-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0049_invite'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='progress_count',
+            field=models.IntegerField(blank=True, editable=False, help_text='The number of attributes in the catalog of this project which have values.', null=True, verbose_name='Progress count'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='progress_total',
+            field=models.IntegerField(blank=True, editable=False, help_text='The number of attributes in the catalog of this project.', null=True, verbose_name='Progress total'),
+        ),
+    ]
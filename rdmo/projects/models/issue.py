@@ -5,6 +5,7 @@ from django.db import models
 from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _
 
+from rdmo.conditions.utils import ConditionResolver
 from rdmo.tasks.models import Task
 
 from ..managers import IssueManager
@@ -50,9 +51,12 @@ class Issue(models.Model):
     def get_absolute_url(self):
         return reverse('project', kwargs={'pk': self.project.pk})
 
-    def resolve(self):
+    def resolve(self, resolver=None):
+        if resolver is None:
+            resolver = ConditionResolver(self.project)
+
         for condition in self.task.conditions.all():
-            if condition.resolve(self.project):
+            if resolver.resolve(condition):
                 return True
 
     @property
@@ -1,9 +1,12 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _
 
 from ..managers import MembershipManager
+from ..utils import clear_project_roles
 
 
 class Membership(models.Model):
@@ -47,3 +50,11 @@ class Membership(models.Model):
     @property
     def is_last_owner(self):
         return not Membership.objects.filter(project=self.project, role='owner').exclude(user=self.user).exists()
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def clear_project_roles_for_membership(sender, instance, **kwargs):
+    # the roles cached on the user object (e.g. request.user) are not valid anymore
+    if Membership.user.is_cached(instance):
+        clear_project_roles(instance.user)
@@ -3,7 +3,7 @@ from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Exists, OuterRef
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
@@ -12,11 +12,13 @@ from mptt.models import MPTTModel, TreeForeignKey
 
 from rdmo.core.models import Model
 from rdmo.domain.models import Attribute
-from rdmo.questions.models import Catalog, Question
+from rdmo.questions.models import Catalog, Question, QuestionSet, Section
 from rdmo.tasks.models import Task
 from rdmo.views.models import View
 
 from ..managers import ProjectManager
+from ..utils import (disable_value_updates, update_project_tree_version,
+                     update_project_version)
 
 
 class Project(MPTTModel, Model):
@@ -64,6 +66,16 @@ class Project(MPTTModel, Model):
         verbose_name=_('Views'),
         help_text=_('The views that will be used for this project.')
     )
+    progress_total = models.IntegerField(
+        null=True, blank=True, editable=False,
+        verbose_name=_('Progress total'),
+        help_text=_('The number of attributes in the catalog of this project.')
+    )
+    progress_count = models.IntegerField(
+        null=True, blank=True, editable=False,
+        verbose_name=_('Progress count'),
+        help_text=_('The number of attributes in the catalog of this project which have values.')
+    )
 
     class Meta:
         ordering = ('tree_id', 'level', 'title')
@@ -85,29 +97,81 @@ class Project(MPTTModel, Model):
                 'parent': [_('A project may not be moved to be a child of itself or one of its descendants.')]
             })
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # store the catalog and the tree as loaded from the database to detect changes in save
+        instance._loaded_catalog_id = instance.__dict__.get('catalog_id')
+        instance._loaded_tree_id = instance.__dict__.get('tree_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if not adding and kwargs.get('update_fields') is None:
+            # the progress counters are updated in the database by the values (see update_progress),
+            # therefore they are left out here, so that concurrent updates are not overwritten
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                       if not (field.primary_key or field.name in ('progress_total', 'progress_count'))]
+
+        super().save(*args, **kwargs)
+
+        if self.catalog_id != getattr(self, '_loaded_catalog_id', None):
+            # the progress counters need to be rebuilt for the new catalog
+            self.progress_total = self.progress_count = None
+            if not adding:
+                Project.objects.filter(pk=self.pk).update(progress_total=None, progress_count=None)
+            self._loaded_catalog_id = self.catalog_id
+
+        loaded_tree_id = getattr(self, '_loaded_tree_id', None)
+        if loaded_tree_id != self.tree_id:
+            # the project was moved to another tree, the version of the new tree is updated
+            # by post_save, but the views of the previous tree have changed as well
+            update_project_tree_version(loaded_tree_id)
+            self._loaded_tree_id = self.tree_id
+
+    def delete(self, *args, **kwargs):
+        # the values are deleted together with the project, therefore the progress and the
+        # version are not updated for every value (the version is updated by post_delete)
+        with disable_value_updates():
+            return super().delete(*args, **kwargs)
+
     @property
     def progress(self):
-        questions = Question.objects.filter(attribute_id=OuterRef('pk'), questionset__section__catalog_id=self.catalog.id)
-        attributes = Attribute.objects.annotate(active=Exists(questions)).filter(active=True).distinct()
-
-        total = attributes.count()
-        values = self.values.filter(snapshot=None) \
-                            .filter(attribute__in=attributes) \
-                            .exclude((models.Q(text='') | models.Q(text=None)) & models.Q(option=None) &
-                                     (models.Q(file='') | models.Q(file=None))) \
-                            .distinct().values('attribute').count()
+        if self.progress_total is None or self.progress_count is None:
+            self.update_progress()
 
         try:
-            ratio = values / total
+            ratio = self.progress_count / self.progress_total
         except ZeroDivisionError:
             ratio = 0
 
         return {
-            'total': total,
-            'values': values,
+            'total': self.progress_total,
+            'values': self.progress_count,
             'ratio': ratio
         }
 
+    def compute_progress(self):
+        if self.catalog_id is None:
+            return 0, 0
+
+        questions = Question.objects.filter(attribute_id=OuterRef('pk'), questionset__section__catalog_id=self.catalog_id)
+        attributes = Attribute.objects.annotate(active=Exists(questions)).filter(active=True).distinct()
+
+        total = attributes.count()
+        count = self.values.filter(snapshot=None) \
+                           .filter(attribute__in=attributes) \
+                           .exclude_empty() \
+                           .distinct().values('attribute').count()
+
+        return total, count
+
+    def update_progress(self):
+        # rebuild the stored progress counters, without touching the other fields
+        self.progress_total, self.progress_count = self.compute_progress()
+        Project.objects.filter(pk=self.pk).update(progress_total=self.progress_total,
+                                                  progress_count=self.progress_count)
+
     @cached_property
     def member(self):
         return self.user.all()
@@ -143,3 +207,44 @@ def reparent_children(sender, instance, **kwargs):
     for child in instance.get_children():
         child.move_to(instance.parent, 'last-child')
         child.save()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def update_project_version_for_project(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_project_version(instance)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def reset_progress_for_question(sender, instance, raw=False, **kwargs):
+    # the progress of the projects using the catalog of the question is rebuilt on the next request,
+    # if the question was moved, the projects using the previous catalog are reset as well
+    if not raw:
+        questionset_ids = {instance.questionset_id, getattr(instance, '_loaded_questionset_id', None)} - {None}
+        Project.objects.filter(catalog__sections__questionsets__in=questionset_ids) \
+                       .update(progress_total=None, progress_count=None)
+
+
+@receiver(post_save, sender=QuestionSet)
+def reset_progress_for_questionset(sender, instance, raw=False, **kwargs):
+    # the questions of a moved question set are updated without signals (see QuestionSet.save)
+    loaded_section_id = getattr(instance, '_loaded_section_id', None)
+    if not raw and loaded_section_id is not None and loaded_section_id != instance.section_id:
+        Project.objects.filter(catalog__sections__in=[loaded_section_id, instance.section_id]) \
+                       .update(progress_total=None, progress_count=None)
+
+
+@receiver(post_save, sender=Section)
+def reset_progress_for_section(sender, instance, raw=False, **kwargs):
+    # the questions of a moved section are updated without signals (see Section.save)
+    loaded_catalog_id = getattr(instance, '_loaded_catalog_id', None)
+    if not raw and loaded_catalog_id is not None and loaded_catalog_id != instance.catalog_id:
+        Project.objects.filter(catalog__in=[loaded_catalog_id, instance.catalog_id]) \
+                       .update(progress_total=None, progress_count=None)
+
+
+@receiver(post_delete, sender=Attribute)
+def reset_progress_for_attribute(sender, instance, **kwargs):
+    Project.objects.update(progress_total=None, progress_count=None)
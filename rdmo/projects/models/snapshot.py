@@ -1,10 +1,15 @@
-from django.db import models
+from functools import partial
+
+from django.db import models, transaction
 from django.urls import reverse
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from rdmo.core.models import Model
 
 from ..managers import SnapshotManager
+from ..utils import disable_value_updates, update_project_version
+from .value import Value
 
 
 class Snapshot(Model):
@@ -46,29 +51,70 @@ class Snapshot(Model):
         super().save()
 
         if copy_values:
-            # loop over values without snapshot and save a copy with a fk to the snapshot
+            # loop over values without snapshot and create a copy with a fk to the snapshot,
+            # values with a file need to be saved one by one, since the path of the file contains their id,
+            # all other values are created using a single bulk_create
+            values = []
             for value in self.project.values.filter(snapshot=None):
                 value.pk = None
                 value.snapshot = self
-                value.save()
 
                 if value.file:
+                    value.save()
                     value.copy_file(value.file_name, value.file)
+                else:
+                    value.updated = now()
+                    values.append(value)
+
+            Value.objects.bulk_create(values)
+
+    def delete(self, *args, **kwargs):
+        # the values of the snapshot do not count for the progress, and the
+        # version of the project is only updated once for all values
+        with disable_value_updates():
+            deleted = super().delete(*args, **kwargs)
+
+        update_project_version(self.project)
+        return deleted
 
     def rollback(self):
-        # remove all current values for this project
-        self.project.values.filter(snapshot=None).delete()
-
-        # remove the snapshot_id from this snapshots values so they are current values
-        for value in self.values.all():
-            value.snapshot = None
-            value.save()
-
-            if value.file:
-                # here, it is ok that django_cleanup deletes the file
-                value.file.save(value.file_name, value.file)
-
-        # remove all snapshot created later and the current_snapshot
-        # this also removes the values of these snapshots
-        for snapshot in self.project.snapshots.filter(created__gte=self.created):
-            snapshot.delete()
+        # the rollback is performed in a single transaction, files are deleted by django_cleanup
+        # (and below) only after the transaction was committed successfully, the progress and the
+        # version of the project are not updated for every value, but rebuilt once at the end
+        files = []
+        try:
+            with transaction.atomic(), disable_value_updates():
+                # remove all current values for this project
+                self.project.values.filter(snapshot=None).delete()
+
+                # remove the snapshot_id from this snapshots values so they are current values
+                self.values.update(snapshot=None, updated=now())
+
+                # move the files of the values from the snapshot to the current values
+                values = []
+                for value in self.project.values.filter(snapshot=None).exclude(models.Q(file='') | models.Q(file=None)):
+                    storage, file_name = value.file.storage, value.file.name
+                    if value.link_file(value.file_name, value.file):
+                        # the file in the directory of the snapshot is deleted after the commit
+                        transaction.on_commit(partial(storage.delete, file_name))
+                        values.append(value)
+                    else:
+                        # here, it is ok that django_cleanup deletes the file
+                        value.file.save(value.file_name, value.file)
+
+                    files.append((value.file.storage, value.file.name))
+
+                Value.objects.bulk_update(values, ['file'])
+
+                # remove all snapshot created later and the current_snapshot
+                # this also removes the values of these snapshots
+                self.project.snapshots.filter(created__gte=self.created).delete()
+
+                # the values were moved without updates, so the progress needs to be rebuilt
+                self.project.update_progress()
+                update_project_version(self.project)
+        except Exception:
+            # the database was rolled back, so the files created for the current values are removed
+            for storage, file_name in files:
+                storage.delete(file_name)
+            raise
@@ -1,9 +1,15 @@
 import mimetypes
+import os
+from collections.abc import Mapping
 from pathlib import Path
 
 import iso8601
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django_cleanup import cleanup
 from rdmo.core.constants import (VALUE_TYPE_BOOLEAN, VALUE_TYPE_CHOICES,
@@ -13,7 +19,9 @@ from rdmo.domain.models import Attribute
 from rdmo.options.models import Option
 
 from ..managers import ValueManager
-from ..utils import get_value_path
+from ..utils import (get_value_path, update_project_tree_version,
+                     update_project_version, value_updates_disabled)
+from .project import Project
 
 
 def get_file_upload_to(instance, filename):
@@ -89,33 +97,18 @@ class Value(Model):
         verbose_name = _('Value')
         verbose_name_plural = _('Values')
 
-    @property
-    def as_dict(self):
-        value_dict = {
-            'id': self.id,
-            'created': self.created,
-            'updated': self.updated,
-            'set_index': self.set_index,
-            'collection_index': self.collection_index,
-            'value_type': self.value_type,
-            'unit': self.unit,
-            'external_id': self.external_id,
-            'value': self.value,
-            'value_and_unit': self.value_and_unit,
-            'is_true': self.is_true,
-            'is_false': self.is_false,
-            'as_number': self.as_number
-        }
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # store if the value was answered when it was loaded, to update the progress of the project
+        if not instance.get_deferred_fields():
+            instance._loaded_is_answered = instance.is_answered
+        return instance
 
-        if self.file:
-            value_dict.update({
-                'file_name': self.file_name,
-                'file_url': self.file_url,
-                'file_type': self.file_type,
-                'file_path': self.file_path
-            })
-
-        return value_dict
+    @cached_property
+    def as_dict(self):
+        # the dict is created once for every instance (e.g. once during the rendering of a view)
+        return ValueDict(self)
 
     @property
     def value(self):
@@ -155,6 +148,10 @@ class Value(Model):
         else:
             return value
 
+    @property
+    def is_answered(self):
+        return bool(self.text or self.option_id or self.file)
+
     @property
     def is_true(self):
         return self.text not in self.FALSE_TEXT
@@ -210,6 +207,127 @@ class Value(Model):
         # copies a file field from a different value over to this value
         # this is tricky, because we need to trick django_cleanup to not delete the original file
         # important for snapshots and import from projects
-        self.file.save(file_name, file_content, save=False)
+        if not self.link_file(file_name, file_content):
+            self.file.save(file_name, file_content, save=False)
+
         cleanup.refresh(self)
         self.save()
+
+    def link_file(self, file_name, file_content):
+        # creates a hard link to the file of a different value instead of copying its content,
+        # this is only possible for files in the local file system on the same device
+        try:
+            source_path = file_content.path
+            storage = self.file.storage
+            name = storage.get_available_name(self.file.field.generate_filename(self, file_name))
+            path = storage.path(name)
+        except (AttributeError, NotImplementedError, ValueError):
+            return False
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.link(source_path, path)
+        except OSError:
+            return False
+
+        self.file.name = name
+        return True
+
+
+class ValueDict(Mapping):
+    # a read-only dict representation of a value for the templates, the entries
+    # are only computed when they are accessed and then stored
+
+    value_keys = (
+        'id',
+        'created',
+        'updated',
+        'set_index',
+        'collection_index',
+        'value_type',
+        'unit',
+        'external_id',
+        'value',
+        'value_and_unit',
+        'is_true',
+        'is_false',
+        'as_number'
+    )
+
+    file_keys = (
+        'file_name',
+        'file_url',
+        'file_type',
+        'file_path'
+    )
+
+    def __init__(self, value):
+        self._value = value
+        self._keys = self.value_keys + self.file_keys if value.file else self.value_keys
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            if key not in self._keys:
+                raise KeyError(key)
+
+            self._cache[key] = getattr(self._value, key)
+
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def update_progress(value, was_answered, is_answered):
+    # update the stored progress counter of the project by the change of a single value,
+    # only the values of the project itself (and not of a snapshot) are relevant
+    if value.snapshot_id is not None or was_answered == is_answered:
+        return
+
+    projects = Project.objects.filter(pk=value.project_id)
+
+    if was_answered is None:
+        # the previous state of the value is unknown, the progress is rebuilt on the next request
+        projects.update(progress_total=None, progress_count=None)
+
+    elif value.attribute_id is not None:
+        # the counter only changes if no other value answers the same attribute
+        values = Value.objects.filter(project_id=value.project_id, snapshot=None, attribute_id=value.attribute_id) \
+                              .exclude(pk=value.pk).exclude_empty()
+
+        if not values.exists():
+            projects.filter(progress_count__isnull=False,
+                            catalog__sections__questionsets__questions__attribute_id=value.attribute_id) \
+                    .update(progress_count=F('progress_count') + (1 if is_answered else -1))
+
+
+def update_project_version_for_value(value):
+    # the project is not fetched for every value, only its tree id is needed if it is not
+    # cached already, values which are deleted in bulk disable these updates altogether
+    if Value.project.is_cached(value):
+        update_project_version(value.project)
+    else:
+        update_project_tree_version(Project.objects.filter(pk=value.project_id)
+                                                   .values_list('tree_id', flat=True).first())
+
+
+@receiver(post_save, sender=Value)
+def update_progress_on_save(sender, instance, created, raw=False, **kwargs):
+    if not (raw or value_updates_disabled()):
+        was_answered = False if created else getattr(instance, '_loaded_is_answered', None)
+        update_progress(instance, was_answered, instance.is_answered)
+        instance._loaded_is_answered = instance.is_answered
+        update_project_version_for_value(instance)
+
+
+@receiver(post_delete, sender=Value)
+def update_progress_on_delete(sender, instance, **kwargs):
+    if value_updates_disabled():
+        return
+
+    update_progress(instance, getattr(instance, '_loaded_is_answered', None), False)
+    update_project_version_for_value(instance)
@@ -1,8 +1,31 @@
-from rdmo.core.renderers import BaseXMLRenderer
+import base64
+from io import StringIO
+
+from rdmo.core.renderers import BaseXMLRenderer, IndentedXMLGenerator
 
 
 class XMLRenderer(BaseXMLRenderer):
 
+    # files are encoded in chunks, the size needs to be a multiple of 3 for base64
+    file_chunk_size = 3 * 64 * 1024
+
+    def render(self, data):
+        return ''.join(self.render_stream(data))
+
+    def render_stream(self, data):
+        # the document is rendered incrementally, render_document and its helpers are
+        # generators which yield whenever a part of the document can be sent
+        stream = StringIO()
+
+        xml = IndentedXMLGenerator(stream, 'utf-8')
+        xml.startDocument()
+        for _ in self.render_document(xml, data):
+            yield stream.getvalue()
+            stream.seek(0)
+            stream.truncate()
+        xml.endDocument()
+        yield stream.getvalue()
+
     def render_document(self, xml, project):
         xml.startElement('project', {
             'xmlns:dc': 'http://purl.org/dc/elements/1.1/'
@@ -26,18 +49,19 @@ class XMLRenderer(BaseXMLRenderer):
         if 'snapshots' in project and project['snapshots']:
             xml.startElement('snapshots', {})
             for snapshot in project['snapshots']:
-                self.render_snapshot(xml, snapshot)
+                yield from self.render_snapshot(xml, snapshot)
             xml.endElement('snapshots')
 
         if 'values' in project and project['values']:
             xml.startElement('values', {})
             for value in project['values']:
-                self.render_value(xml, value)
+                yield from self.render_value(xml, value)
             xml.endElement('values')
 
         self.render_text_element(xml, 'created', {}, project['created'])
         self.render_text_element(xml, 'updated', {}, project['updated'])
         xml.endElement('project')
+        yield
 
     def render_snapshot(self, xml, snapshot):
         xml.startElement('snapshot', {})
@@ -47,7 +71,7 @@ class XMLRenderer(BaseXMLRenderer):
         if 'values' in snapshot and snapshot['values']:
             xml.startElement('values', {})
             for value in snapshot['values']:
-                self.render_value(xml, value)
+                yield from self.render_value(xml, value)
             xml.endElement('values')
 
         self.render_text_element(xml, 'created', {}, snapshot['created'])
@@ -61,10 +85,25 @@ class XMLRenderer(BaseXMLRenderer):
         self.render_text_element(xml, 'collection_index', {}, value['collection_index'])
         self.render_text_element(xml, 'text', {}, value['text'])
         self.render_text_element(xml, 'option', {'dc:uri': value['option']}, None)
-        self.render_text_element(xml, 'file', {'name': value['file_name']}, value['file_content'])
+        yield from self.render_file_element(xml, 'file', {'name': value['file_name']}, value['file_content'])
         self.render_text_element(xml, 'value_type', {}, value['value_type'])
         self.render_text_element(xml, 'unit', {}, value['unit'])
         self.render_text_element(xml, 'external_id', {}, value['external_id'])
         self.render_text_element(xml, 'created', {}, value['created'])
         self.render_text_element(xml, 'updated', {}, value['updated'])
         xml.endElement('value')
+        yield
+
+    def render_file_element(self, xml, tag, attrs, file):
+        attrs = dict((key, value) for key, value in attrs.items() if value)
+
+        xml.startElement(tag, attrs)
+        if file:
+            file.open('rb')
+            try:
+                for chunk in file.chunks(self.file_chunk_size):
+                    xml.characters(base64.b64encode(chunk).decode())
+                    yield
+            finally:
+                file.close()
+        xml.endElement(tag)
@@ -1,40 +1,46 @@
 import rules
 
+from .utils import get_project_roles
+
 
 @rules.predicate
 def is_project_member(user, project):
-    return user in project.member or (project.parent and is_project_member(user, project.parent))
+    return bool(get_project_roles(user, project)[1])
 
 
 @rules.predicate
 def is_current_project_member(user, project):
-    return user in project.member
+    return bool(get_project_roles(user, project)[0])
 
 
 @rules.predicate
 def is_project_owner(user, project):
-    return user in project.owners or (project.parent and is_project_owner(user, project.parent))
+    return 'owner' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_manager(user, project):
-    return user in project.managers or (project.parent and is_project_manager(user, project.parent))
+    return 'manager' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_author(user, project):
-    return user in project.authors or (project.parent and is_project_author(user, project.parent))
+    return 'author' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_project_guest(user, project):
-    return user in project.guests or (project.parent and is_project_guest(user, project.parent))
+    return 'guest' in get_project_roles(user, project)[1]
 
 
 @rules.predicate
 def is_site_manager(user, project):
     if user.is_authenticated:
-        return user.role.manager.filter(pk=project.site.pk).exists()
+        # the sites are stored on the user object, which only lives as long as the request
+        site_ids = getattr(user, '_manager_site_ids', None)
+        if site_ids is None:
+            site_ids = user._manager_site_ids = set(user.role.manager.values_list('pk', flat=True))
+        return project.site_id in site_ids
     else:
         return False
 
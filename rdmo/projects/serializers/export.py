@@ -1,5 +1,3 @@
-import base64
-
 from rest_framework import serializers
 
 from ..models import Project, Snapshot, Value
@@ -29,8 +27,9 @@ class ValueSerializer(serializers.ModelSerializer):
         )
 
     def get_file_content(self, obj):
+        # the file is read and encoded by the renderer, chunk by chunk
         if obj.file:
-            return base64.b64encode(obj.file.read())
+            return obj.file
 
 
 class SnapshotSerializer(serializers.ModelSerializer):
@@ -48,7 +47,12 @@ class SnapshotSerializer(serializers.ModelSerializer):
         )
 
     def get_values(self, obj):
-        values = Value.objects.filter(snapshot=obj)
+        try:
+            # the values of all snapshots were fetched at once by the ProjectSerializer
+            values = self.context['values'].get(obj.id, [])
+        except KeyError:
+            values = Value.objects.filter(snapshot=obj).select_related('attribute', 'option')
+
         serializer = ValueSerializer(instance=values, many=True)
         return serializer.data
 
@@ -76,8 +80,17 @@ class ProjectSerializer(serializers.ModelSerializer):
             'updated'
         )
 
+    def to_representation(self, instance):
+        # fetch the values of the project and all its snapshots with one query,
+        # and partition them by snapshot (the values of the project itself use None)
+        values = self.context['values'] = {}
+        for value in Value.objects.filter(project=instance).select_related('attribute', 'option'):
+            values.setdefault(value.snapshot_id, []).append(value)
+
+        return super().to_representation(instance)
+
     def get_values(self, obj):
-        values = Value.objects.filter(project=obj, snapshot=None)
+        values = self.context['values'].get(None, [])
         serializer = ValueSerializer(instance=values, many=True)
         return serializer.data
 
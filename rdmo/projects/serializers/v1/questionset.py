@@ -144,16 +144,10 @@ class QuestionSetSerializer(MarkdownSerializerMixin, serializers.ModelSerializer
         )
 
     def get_prev(self, obj):
-        try:
-            return QuestionSet.objects.get_prev(obj.pk).pk
-        except QuestionSet.DoesNotExist:
-            return None
+        return QuestionSet.objects.get_prev_pk(obj)
 
     def get_next(self, obj):
-        try:
-            return QuestionSet.objects.get_next(obj.pk).pk
-        except QuestionSet.DoesNotExist:
-            return None
+        return QuestionSet.objects.get_next_pk(obj)
 
     def get_section(self, obj):
         return {
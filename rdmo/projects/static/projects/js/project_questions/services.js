@@ -82,6 +82,9 @@ angular.module('project_questions')
             initializing = true;
 
             return service.fetchQuestionSet(questionset_id)
+            .then(function() {
+                return service.resolveConditions();
+            })
             .then(function() {
                 return service.checkConditions();
             })
@@ -191,29 +194,42 @@ angular.module('project_questions')
         });
     };
 
+    service.resolveConditions = function() {
+        // resolve all conditions of the questionset and its optionsets with one request,
+        // the request is skipped if none of them has any conditions
+        var has_conditions = function(element) {
+            return angular.isArray(element.conditions) && element.conditions.length > 0;
+        };
+
+        if (!has_conditions(future.questionset) && !future.questionset.questions.some(function(question) {
+            return has_conditions(question) || question.optionsets.some(has_conditions);
+        })) {
+            future.conditions = {};
+            return $q.when();
+        }
+
+        return resources.projects.get({
+            detail_action: 'resolve',
+            questionset: future.questionset.id,
+            id: service.project.id,
+        }, function(response) {
+            future.conditions = response.results;
+        }).$promise;
+    };
+
     service.checkConditions = function() {
         if (future.questionset.conditions && future.questionset.conditions.length) {
-            var results = [],
-                promises = [];
+            var results = [];
 
-            // fetch the values for these conditions from the server
             angular.forEach(future.questionset.conditions, function (condition) {
-                promises.push(resources.projects.get({
-                    detail_action: 'resolve',
-                    condition: condition.id,
-                    id: service.project.id,
-                }, function(response) {
-                    results.push(response.result);
-                }).$promise);
+                results.push(future.conditions[condition.id] === true);
             });
 
-            return $q.all(promises).then(function() {
-                if (results.length && results.indexOf(true) === -1) {
-                    return $q.reject(false);
-                } else {
-                    return $q.when();
-                }
-            });
+            if (results.length && results.indexOf(true) === -1) {
+                return $q.reject(false);
+            } else {
+                return $q.when();
+            }
         } else {
             return $q.when();
         }
@@ -257,8 +273,6 @@ angular.module('project_questions')
     };
 
     service.checkOptionSetConditions = function() {
-        promises = [];
-
         angular.forEach(future.questionset.questions, function(question) {
             if (question.optionsets.length) {
                 angular.forEach(question.optionsets, function(optionset) {
@@ -270,25 +284,19 @@ angular.module('project_questions')
                         });
 
                         angular.forEach(optionset.conditions, function (condition_id) {
-                            promises.push(resources.projects.get({
-                                detail_action: 'resolve',
-                                condition: condition_id,
-                                id: service.project.id,
-                            }, function(response) {
-                                if (response.result) {
-                                    // un-hide all options
-                                    angular.forEach(optionset.options, function(option) {
-                                        option.hidden = false;
-                                    });
-                                }
-                            }).$promise);
+                            if (future.conditions[condition_id] === true) {
+                                // un-hide all options
+                                angular.forEach(optionset.options, function(option) {
+                                    option.hidden = false;
+                                });
+                            }
                         });
                     }
                 });
             }
         });
 
-        return $q.all(promises);
+        return $q.when();
     };
 
     service.fetchValues = function() {
@@ -0,0 +1,28 @@
+import io
+
+from django.core.management import call_command
+
+from ..models import Project
+
+
+def test_rebuild_progress(db):
+    Project.objects.update(progress_total=None, progress_count=None)
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    call_command('rebuild_progress', stdout=stdout, stderr=stderr)
+
+    assert stdout.getvalue() == 'Progress rebuilt for %i projects.\n' % Project.objects.count()
+    assert not stderr.getvalue()
+
+    for project in Project.objects.all():
+        assert (project.progress_total, project.progress_count) == project.compute_progress()
+
+
+def test_rebuild_progress_project(db):
+    Project.objects.update(progress_total=None, progress_count=None)
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    call_command('rebuild_progress', '1', stdout=stdout, stderr=stderr)
+
+    assert stdout.getvalue() == 'Progress rebuilt for 1 projects.\n'
+    assert Project.objects.filter(progress_total=None).count() == Project.objects.count() - 1
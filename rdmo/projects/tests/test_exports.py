@@ -0,0 +1,65 @@
+import pytest
+
+from django.db.models import QuerySet
+
+from ..exports import Export
+from ..models import Project, Value
+
+projects = [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_export_get_values(db, django_assert_num_queries, project_id):
+    project = Project.objects.get(id=project_id)
+    values = project.values.filter(snapshot=None).select_related('attribute')
+    paths = {value.attribute.path for value in values if value.attribute}
+
+    export = Export('export', 'Export', 'rdmo.projects.exports.Export')
+    export.project = project
+    export.get_values_index()
+
+    for path in paths:
+        set_values = list(values.filter(attribute__path=path))
+
+        with django_assert_num_queries(0):
+            assert export.get_set(path) == set_values
+            for set_index in range(3):
+                assert export.get_values(path, set_index) == \
+                    [value for value in set_values if value.set_index == set_index]
+
+    with django_assert_num_queries(0):
+        assert export.get_set('does/not/exist') == []
+        assert export.get_value('does/not/exist') is None
+
+
+def test_export_get_queryset(db):
+    project = Project.objects.get(id=1)
+    value = project.values.filter(snapshot=None).exclude(attribute=None).first()
+
+    export = Export('export', 'Export', 'rdmo.projects.exports.Export')
+    export.project = project
+
+    values = export.get_queryset(value.attribute.path)
+    assert isinstance(values, QuerySet)
+    assert list(values) == export.get_set(value.attribute.path)
+    assert list(values.filter(set_index=value.set_index).order_by('collection_index')) == \
+        list(Value.objects.filter(project=project, snapshot=None, attribute__path=value.attribute.path,
+                                  set_index=value.set_index).order_by('collection_index'))
+    assert values.filter(pk=value.pk).exists()
+    assert not values.filter(pk=-1).exists()
+
+    values = export.get_queryset(value.attribute.path, value.set_index)
+    assert list(values) == export.get_values(value.attribute.path, value.set_index)
+
+
+def test_export_get_values_snapshot(db):
+    project = Project.objects.get(id=1)
+    snapshot = project.snapshots.first()
+    value = snapshot.values.exclude(attribute=None).first()
+
+    export = Export('export', 'Export', 'rdmo.projects.exports.Export')
+    export.project = project
+    export.get_values_index()
+
+    export.snapshot = snapshot
+    assert export.get_value(value.attribute.path, value.set_index, value.collection_index) == value
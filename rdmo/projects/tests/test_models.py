@@ -1,9 +1,33 @@
+import os
+
 import pytest
 
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils.timezone import now
+
+from rdmo.domain.models import Attribute
+from rdmo.questions.models import Catalog, Question, QuestionSet, Section
+
 from ..models import Integration, Issue, Membership, Project, Snapshot, Value
+from ..utils import get_project_version
 
 projects = [1, 2, 3, 4, 5]
 
+view_project_permission_map = {
+    'owner': [1, 2, 3, 4, 5],
+    'manager': [1, 3, 5],
+    'author': [1, 3, 5],
+    'guest': [1, 3, 5],
+    'user': [],
+    'api': [1, 2, 3, 4, 5],
+    'site': [1, 2, 3, 4, 5]
+}
+
+
+def get_files(path):
+    return sorted(os.path.join(root, file_name) for root, dirs, files in os.walk(path) for file_name in files)
+
 
 def test_integration_str(db):
     instances = Integration.objects.all()
@@ -41,6 +65,44 @@ def test_value_str(db):
         assert str(instance)
 
 
+def test_value_as_dict(db):
+    instances = Value.objects.all()
+    for instance in instances:
+        value_dict = instance.as_dict
+
+        assert value_dict is instance.as_dict
+        assert value_dict['id'] == instance.id
+        assert value_dict['value'] == instance.value
+        assert value_dict['value_and_unit'] == instance.value_and_unit
+        assert ('file_url' in value_dict) == bool(instance.file)
+
+        with pytest.raises(KeyError):
+            value_dict['missing']
+
+
+def test_value_as_dict_lazy(db, mocker):
+    file_url = mocker.patch.object(Value, 'file_url', new_callable=mocker.PropertyMock)
+    instance = Value.objects.exclude(file='').exclude(file=None).first()
+
+    instance.as_dict['value']
+    file_url.assert_not_called()
+
+    instance.as_dict['file_url']
+    instance.as_dict['file_url']
+    file_url.assert_called_once()
+
+
+@pytest.mark.parametrize('username', view_project_permission_map.keys())
+def test_project_filter_user(db, django_assert_num_queries, username):
+    user = User.objects.get(username=username)
+    queryset = Project.objects.filter_user(user)
+
+    with django_assert_num_queries(1):
+        project_ids = sorted(queryset.values_list('id', flat=True))
+
+    assert project_ids == view_project_permission_map[username]
+
+
 @pytest.mark.parametrize('project_id', projects)
 def test_project_delete(db, project_id):
     project = Project.objects.get(id=project_id)
@@ -56,3 +118,257 @@ def test_project_delete(db, project_id):
             assert child.parent is None
         else:
             assert child.parent.id is project_parent_id
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_snapshot_create(db, files, project_id):
+    project = Project.objects.get(id=project_id)
+    values = project.values.filter(snapshot=None)
+
+    snapshot = Snapshot(project=project, title='A new snapshot')
+    snapshot.save()
+
+    assert snapshot.values.count() == values.count()
+
+    for value in values:
+        snapshot_value = snapshot.values.get(attribute=value.attribute, set_index=value.set_index,
+                                             collection_index=value.collection_index)
+        assert snapshot_value.text == value.text
+        assert snapshot_value.option == value.option
+
+        if value.file:
+            # the file of the snapshot value is a hard link to the file of the current value
+            assert snapshot_value.file.name != value.file.name
+            assert os.path.samefile(snapshot_value.file.path, value.file.path)
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_snapshot_rollback(db, files, project_id):
+    project = Project.objects.get(id=project_id)
+
+    for snapshot in project.snapshots.all():
+        snapshot_values = list(snapshot.values.values_list('id', flat=True))
+        later_snapshots = list(project.snapshots.filter(created__gte=snapshot.created).values_list('id', flat=True))
+
+        snapshot.rollback()
+
+        assert sorted(project.values.filter(snapshot=None).values_list('id', flat=True)) == sorted(snapshot_values)
+        assert not Snapshot.objects.filter(id__in=later_snapshots).exists()
+
+        for value in project.values.filter(snapshot=None).exclude(file=''):
+            assert os.path.exists(value.file.path)
+            assert value.file_path
+
+        # only roll back once, since the later snapshots are gone
+        break
+
+
+@pytest.mark.parametrize('values_count', [0, 100])
+def test_snapshot_rollback_queries(db, files, django_assert_max_num_queries, values_count):
+    project = Project.objects.get(id=1)
+    snapshot = project.snapshots.order_by('created').first()
+    attribute = Attribute.objects.first()
+
+    # the number of queries does not depend on the number of values
+    Value.objects.bulk_create([
+        Value(project=project, snapshot=None, attribute=attribute, set_index=i, text='text',
+              created=now(), updated=now())
+        for i in range(values_count)
+    ] + [
+        Value(project=project, snapshot=snapshot, attribute=attribute, set_index=i, text='text',
+              created=now(), updated=now())
+        for i in range(values_count)
+    ])
+
+    with django_assert_max_num_queries(15):
+        snapshot.rollback()
+
+    project.refresh_from_db()
+    assert (project.progress_total, project.progress_count) == project.compute_progress()
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_snapshot_rollback_error(db, settings, files, mocker, project_id):
+    project = Project.objects.get(id=project_id)
+    current_values = sorted(project.values.filter(snapshot=None).values_list('id', flat=True))
+    snapshots = sorted(project.snapshots.values_list('id', flat=True))
+    current_files = get_files(settings.MEDIA_ROOT)
+
+    mocker.patch('django.db.models.query.QuerySet.bulk_update', side_effect=RuntimeError)
+
+    for snapshot in project.snapshots.all():
+        with pytest.raises(RuntimeError):
+            snapshot.rollback()
+
+        assert sorted(project.values.filter(snapshot=None).values_list('id', flat=True)) == current_values
+        assert sorted(project.snapshots.values_list('id', flat=True)) == snapshots
+
+        # no files are left over from the rollback
+        assert get_files(settings.MEDIA_ROOT) == current_files
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_project_progress(db, project_id):
+    project = Project.objects.get(id=project_id)
+    total, count = project.compute_progress()
+
+    assert project.progress['total'] == total
+    assert project.progress['values'] == count
+
+    project = Project.objects.get(id=project_id)
+    assert project.progress_total == total
+    assert project.progress_count == count
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_project_progress_value(db, project_id):
+    project = Project.objects.get(id=project_id)
+    total, count = project.compute_progress()
+    project.update_progress()
+
+    attribute = Attribute.objects.filter(questions__questionset__section__catalog=project.catalog) \
+                                 .exclude(values__project=project, values__snapshot=None).first()
+
+    value = Value.objects.create(project=project, attribute=attribute, text='')
+    assert Project.objects.get(id=project_id).progress_count == count
+
+    value.text = 'test'
+    value.save()
+    assert Project.objects.get(id=project_id).progress_count == count + 1
+
+    Value.objects.create(project=project, attribute=attribute, text='test', collection_index=1)
+    assert Project.objects.get(id=project_id).progress_count == count + 1
+
+    value.delete()
+    assert Project.objects.get(id=project_id).progress_count == count + 1
+
+    project.values.filter(attribute=attribute).delete()
+    assert Project.objects.get(id=project_id).progress_count == count
+    assert Project.objects.get(id=project_id).compute_progress() == (total, count)
+
+
+def test_project_progress_catalog(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+
+    project = Project.objects.get(id=1)
+    project.catalog = Catalog.objects.exclude(id=project.catalog_id).first()
+    project.save()
+
+    project = Project.objects.get(id=1)
+    assert project.progress_total is None
+    assert project.progress_count is None
+    assert project.progress['total'] == project.compute_progress()[0]
+
+
+def test_project_progress_save(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+
+    # the counter is changed by a different request in the meantime
+    Project.objects.filter(id=1).update(progress_count=0)
+
+    project.title = 'changed'
+    project.save()
+
+    project = Project.objects.get(id=1)
+    assert project.title == 'changed'
+    assert project.progress_count == 0
+
+
+def test_project_version_value(db):
+    project = Project.objects.get(id=1)
+    version = get_project_version(project)
+
+    value = Value.objects.filter(project=project, snapshot=None).first()
+    value = Value.objects.get(id=value.id)
+    value.save()
+
+    assert not Value.project.is_cached(value)
+    assert get_project_version(project) != version
+
+
+def test_project_version_value_rollback(db):
+    project = Project.objects.get(id=1)
+    version = get_project_version(project)
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            value = Value.objects.filter(project=project, snapshot=None).first()
+            value.save()
+            assert get_project_version(project) == version
+            raise RuntimeError
+
+    assert get_project_version(project) == version
+
+
+def test_project_version_move(db):
+    project = Project.objects.get(id=5)
+    parent = Project.objects.get(id=1)
+    old_version, new_version = get_project_version(project), get_project_version(parent)
+
+    project.parent = parent
+    project.save()
+
+    assert get_project_version(Project.objects.get(id=2)) != old_version
+    assert get_project_version(parent) != new_version
+
+
+def test_project_progress_question(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+
+    question = Question.objects.filter(questionset__section__catalog=project.catalog).first()
+    question.save()
+
+    project = Project.objects.get(id=1)
+    assert project.progress_total is None
+    assert project.progress_count is None
+
+
+def test_project_progress_section_move(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+    catalog = Catalog.objects.exclude(id=project.catalog_id).first()
+
+    for section in Section.objects.filter(catalog=project.catalog):
+        section.catalog = catalog
+        section.save()
+
+    project = Project.objects.get(id=1)
+    assert project.progress_total is None
+    assert project.progress_count is None
+    assert (project.progress['total'], project.progress['values']) == project.compute_progress() == (0, 0)
+
+
+def test_project_progress_questionset_move(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+    catalog = Catalog.objects.exclude(id=project.catalog_id).first()
+    section = Section.objects.create(uri_prefix=catalog.uri_prefix, key='new', catalog=catalog)
+
+    questionset = QuestionSet.objects.filter(section__catalog=project.catalog).exclude(questions=None).first()
+    questionset.section = section
+    questionset.save()
+
+    project = Project.objects.get(id=1)
+    assert project.progress_total is None
+    assert project.progress_count is None
+    assert (project.progress['total'], project.progress['values']) == project.compute_progress()
+
+
+def test_project_progress_question_move(db):
+    project = Project.objects.get(id=1)
+    project.update_progress()
+    catalog = Catalog.objects.exclude(id=project.catalog_id).first()
+    section = Section.objects.create(uri_prefix=catalog.uri_prefix, key='new', catalog=catalog)
+    questionset = QuestionSet.objects.create(uri_prefix=catalog.uri_prefix, key='new', section=section)
+    Project.objects.filter(id=1).update(progress_total=10, progress_count=5)
+
+    question = Question.objects.filter(questionset__section__catalog=project.catalog).first()
+    question.questionset = questionset
+    question.save()
+
+    project = Project.objects.get(id=1)
+    assert project.progress_total is None
+    assert project.progress_count is None
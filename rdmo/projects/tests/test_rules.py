@@ -0,0 +1,57 @@
+import pytest
+from django.contrib.auth.models import User
+
+from ..models import Membership, Project
+
+users = ('owner', 'manager', 'author', 'guest', 'user', 'site')
+
+view_project_permission_map = {
+    'owner': [1, 2, 3, 4, 5],
+    'manager': [1, 3, 5],
+    'author': [1, 3, 5],
+    'guest': [1, 3, 5],
+    'site': [1, 2, 3, 4, 5]
+}
+
+change_project_permission_map = {
+    'owner': [1, 2, 3, 4, 5],
+    'manager': [1, 3, 5],
+    'site': [1, 2, 3, 4, 5]
+}
+
+delete_project_permission_map = {
+    'owner': [1, 2, 3, 4, 5],
+    'site': [1, 2, 3, 4, 5]
+}
+
+
+@pytest.mark.parametrize('username', users)
+def test_project_permissions(db, django_assert_max_num_queries, username):
+    user = User.objects.get(username=username)
+    projects = Project.objects.all()
+    trees = {project.tree_id for project in projects}
+
+    # one query for each tree and two queries for the role of the user
+    with django_assert_max_num_queries(len(trees) + 2):
+        for project in projects:
+            assert user.has_perm('projects.view_project_object', project) == \
+                (project.id in view_project_permission_map.get(username, []))
+            assert user.has_perm('projects.change_project_object', project) == \
+                (project.id in change_project_permission_map.get(username, []))
+            assert user.has_perm('projects.delete_project_object', project) == \
+                (project.id in delete_project_permission_map.get(username, []))
+
+
+def test_project_permissions_membership(db):
+    user = User.objects.get(username='user')
+    project = Project.objects.get(id=2)
+
+    assert not user.has_perm('projects.change_project_object', project)
+
+    membership = Membership.objects.create(project=project, user=user, role='manager')
+    assert user.has_perm('projects.change_project_object', project)
+    assert user.has_perm('projects.change_project_object', project.get_descendants().first())
+    assert not user.has_perm('projects.delete_project_object', project)
+
+    membership.delete()
+    assert not user.has_perm('projects.change_project_object', project)
@@ -0,0 +1,19 @@
+import pytest
+
+from ..models import Project
+from ..serializers.export import ProjectSerializer as ExportSerializer
+
+projects = [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_export_serializer(db, django_assert_num_queries, project_id):
+    project = Project.objects.get(id=project_id)
+
+    # catalog, snapshots, values, tasks and views
+    with django_assert_num_queries(5):
+        data = ExportSerializer(project).data
+
+    assert len(data['values']) == project.values.filter(snapshot=None).count()
+    for snapshot_data, snapshot in zip(data['snapshots'], project.snapshots.all()):
+        assert len(snapshot_data['values']) == snapshot.values.count()
@@ -1,4 +1,6 @@
+import base64
 import re
+import xml.etree.ElementTree as et
 
 import pytest
 from django.urls import reverse
@@ -505,6 +507,13 @@ def test_project_export_xml(db, client, files, username, password, project_id):
 
     if project_id in export_project_permission_map.get(username, []):
         assert response.status_code == 200
+
+        root = et.fromstring(b''.join(response.streaming_content))
+        assert root.tag == 'project'
+        for value in root.iter('value'):
+            file = value.find('file')
+            if file.get('name'):
+                assert base64.b64decode(file.text)
     else:
         if password:
             assert response.status_code == 403
@@ -522,6 +531,7 @@ def test_project_export_csv(db, client, username, password, project_id):
 
     if project_id in export_project_permission_map.get(username, []):
         assert response.status_code == 200
+        assert b''.join(response.streaming_content).decode().splitlines()
     else:
         if password:
             assert response.status_code == 403
@@ -539,6 +549,7 @@ def test_project_export_csvsemicolon(db, client, username, password, project_id)
 
     if project_id in export_project_permission_map.get(username, []):
         assert response.status_code == 200
+        assert b''.join(response.streaming_content).decode().splitlines()
     else:
         if password:
             assert response.status_code == 403
@@ -1,6 +1,10 @@
 import pytest
 from django.urls import reverse
 
+from rdmo.conditions.models import Condition
+from rdmo.options.models import OptionSet
+from rdmo.questions.models import Question
+
 from ..models import Project
 
 users = (
@@ -46,6 +50,7 @@ urlnames = {
 
 projects = [1, 2, 3, 4, 5]
 conditions = [1]
+questionsets = [61, 64, 70]
 
 project_values = 34
 project_total = 41
@@ -209,6 +214,27 @@ def test_overview(db, client, username, password, project_id, condition_id):
             assert response.status_code == 401
 
 
+@pytest.mark.parametrize('project_id', projects)
+def test_overview_etag(db, client, project_id):
+    client.login(username='owner', password='owner')
+
+    url = reverse(urlnames['overview'], args=[project_id])
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.has_header('ETag')
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    project = Project.objects.get(pk=project_id)
+    project.title = 'New title'
+    project.save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 200
+    assert response.json().get('title') == 'New title'
+
+
 @pytest.mark.parametrize('username,password', users)
 @pytest.mark.parametrize('project_id', projects)
 @pytest.mark.parametrize('condition_id', conditions)
@@ -228,6 +254,84 @@ def test_resolve(db, client, username, password, project_id, condition_id):
             assert response.status_code == 401
 
 
+@pytest.mark.parametrize('username,password', users)
+@pytest.mark.parametrize('project_id', projects)
+def test_resolve_conditions(db, client, username, password, project_id):
+    client.login(username=username, password=password)
+
+    condition_ids = Condition.objects.values_list('id', flat=True)
+
+    url = reverse(urlnames['resolve'], args=[project_id]) + '?' + '&'.join(
+        'conditions={}'.format(condition_id) for condition_id in condition_ids
+    )
+    response = client.get(url)
+
+    if project_id in view_project_permission_map.get(username, []):
+        assert response.status_code == 200
+        assert isinstance(response.json().get('results'), dict)
+
+        project = Project.objects.get(pk=project_id)
+        for condition in Condition.objects.all():
+            assert response.json()['results'][str(condition.id)] == condition.resolve(project)
+    else:
+        if password:
+            assert response.status_code == 404
+        else:
+            assert response.status_code == 401
+
+
+@pytest.mark.parametrize('username,password', users)
+@pytest.mark.parametrize('project_id', projects)
+@pytest.mark.parametrize('questionset_id', questionsets)
+def test_resolve_questionset(db, client, username, password, project_id, questionset_id):
+    client.login(username=username, password=password)
+
+    url = reverse(urlnames['resolve'], args=[project_id]) + '?questionset={}'.format(questionset_id)
+    response = client.get(url)
+
+    if project_id in view_project_permission_map.get(username, []):
+        assert response.status_code == 200
+
+        project = Project.objects.get(pk=project_id)
+        conditions = Condition.objects.filter(questionsets=questionset_id)
+        assert sorted(response.json().get('results')) == sorted([str(condition.id) for condition in conditions])
+        for condition in conditions:
+            assert response.json()['results'][str(condition.id)] == condition.resolve(project)
+    else:
+        if password:
+            assert response.status_code == 404
+        else:
+            assert response.status_code == 401
+
+
+@pytest.mark.parametrize('username,password', users)
+@pytest.mark.parametrize('project_id', projects)
+def test_resolve_questionset_optionset(db, client, username, password, project_id):
+    client.login(username=username, password=password)
+
+    # the option set with a condition is used by a question of a question set without conditions
+    optionset = OptionSet.objects.exclude(conditions=None).first()
+    question = Question.objects.filter(questionset__conditions=None).first()
+    question.optionsets.add(optionset)
+
+    url = reverse(urlnames['resolve'], args=[project_id]) + '?questionset={}'.format(question.questionset_id)
+    response = client.get(url)
+
+    if project_id in view_project_permission_map.get(username, []):
+        assert response.status_code == 200
+
+        project = Project.objects.get(pk=project_id)
+        conditions = optionset.conditions.all()
+        assert sorted(response.json().get('results')) == sorted([str(condition.id) for condition in conditions])
+        for condition in conditions:
+            assert response.json()['results'][str(condition.id)] == condition.resolve(project)
+    else:
+        if password:
+            assert response.status_code == 404
+        else:
+            assert response.status_code == 401
+
+
 @pytest.mark.parametrize('username,password', users)
 @pytest.mark.parametrize('project_id', projects)
 def test_progress(db, client, username, password, project_id):
@@ -1,6 +1,8 @@
 import pytest
 from django.urls import reverse
 
+from rdmo.questions.models import Question
+
 users = (
     ('owner', 'owner'),
     ('manager', 'manager'),
@@ -44,3 +46,21 @@ def test_detail(db, client, username, password, project_id, questionset_id):
         assert response.json().get('id') == questionset_id
     else:
         assert response.status_code == 404
+
+
+@pytest.mark.parametrize('questionset_id', questionsets)
+def test_detail_etag(db, client, questionset_id):
+    client.login(username='owner', password='owner')
+
+    url = reverse(urlnames['detail'], args=[projects[0], questionset_id])
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.has_header('ETag')
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    Question.objects.filter(questionset_id=questionset_id).first().save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 200
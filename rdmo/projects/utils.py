@@ -1,8 +1,14 @@
 import logging
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
+from rdmo.core.cache import get_version, update_version
+
 logger = logging.getLogger(__name__)
 
+disabled = threading.local()
+
 
 def get_value_path(project, snapshot=None):
     if snapshot is None:
@@ -20,6 +26,77 @@ def is_last_owner(project, user):
         return False
 
 
+def get_project_version_cache_key(tree_id):
+    # the version is shared by all projects of a tree, since a project
+    # can also contain the values of its descendants (e.g. in views)
+    return 'project-version-{}'.format(tree_id)
+
+
+def get_project_version(project):
+    return get_version(get_project_version_cache_key(project.tree_id))
+
+
+def update_project_version(project):
+    update_project_tree_version(project.tree_id)
+
+
+def update_project_tree_version(tree_id):
+    if tree_id is not None:
+        update_version(get_project_version_cache_key(tree_id))
+
+
+@contextmanager
+def disable_value_updates():
+    # switch off the updates of the progress and the version of the projects, which are performed
+    # for every saved or deleted value, the caller needs to rebuild both at the end
+    if getattr(disabled, 'value_updates', False):
+        # updates are already disabled by an outer block
+        yield
+        return
+
+    disabled.value_updates = True
+    try:
+        yield
+    finally:
+        disabled.value_updates = False
+
+
+def value_updates_disabled():
+    return getattr(disabled, 'value_updates', False)
+
+
+def get_project_roles(user, project):
+    # returns the roles of the user for the project itself and for the project including its ancestors,
+    # the memberships of the user in the tree of the project are fetched once and stored on the user
+    # object, which only lives as long as the request
+    if not user.is_authenticated or project.tree_id is None:
+        return set(), set()
+
+    memberships = getattr(user, '_project_memberships', None)
+    if memberships is None:
+        memberships = user._project_memberships = {}
+
+    if project.tree_id not in memberships:
+        from .models import Membership
+        memberships[project.tree_id] = list(
+            Membership.objects.filter(user=user, project__tree_id=project.tree_id)
+                              .values_list('project_id', 'project__lft', 'project__rght', 'role')
+        )
+
+    current_roles, roles = set(), set()
+    for project_id, lft, rght, role in memberships[project.tree_id]:
+        if lft <= project.lft and rght >= project.rght:
+            roles.add(role)
+            if project_id == project.id:
+                current_roles.add(role)
+
+    return current_roles, roles
+
+
+def clear_project_roles(user):
+    user._project_memberships = None
+
+
 def save_import_values(project, values, checked):
     for value in values:
         if value.attribute:
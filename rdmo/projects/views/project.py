@@ -33,10 +33,7 @@ class ProjectsView(LoginRequiredMixin, FilterView):
 
     def get_queryset(self):
         # prepare projects queryset for this user
-        queryset = Project.objects.filter(user=self.request.user)
-        for instance in queryset:
-            queryset |= instance.get_descendants()
-        queryset = queryset.distinct()
+        queryset = Project.objects.filter_member(self.request.user)
 
         # prepare subquery for role
         membership_subquery = models.Subquery(
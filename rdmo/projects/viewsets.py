@@ -13,13 +13,17 @@ from rest_framework.response import Response
 from rest_framework.viewsets import (GenericViewSet, ModelViewSet,
                                      ReadOnlyModelViewSet)
 from rest_framework_extensions.cache.mixins import RetrieveCacheResponseMixin
+from rest_framework_extensions.etag.decorators import etag
 from rest_framework_extensions.mixins import NestedViewSetMixin
+from rest_framework_extensions.utils import default_object_cache_key_func
 
 from rdmo.conditions.models import Condition
+from rdmo.conditions.utils import ConditionResolver
 from rdmo.core.permissions import HasModelPermission, HasObjectPermission
 from rdmo.core.utils import human2bytes, return_file_response
 from rdmo.options.models import OptionSet
 from rdmo.questions.models import Catalog, Question, QuestionSet
+from rdmo.questions.utils import get_catalog_etag, get_catalog_version
 
 from .filters import SnapshotFilterBackend, ValueFilterBackend
 from .models import (Continuation, Integration, Issue, Membership, Project,
@@ -54,7 +58,14 @@ class ProjectViewSet(ModelViewSet):
     def get_queryset(self):
         return Project.objects.filter_user(self.request.user)
 
+    def overview_etag_func(self, **kwargs):
+        project = self.get_object()
+        serializer = ProjectOverviewSerializer(project, context={'request': self.request})
+        return get_catalog_etag(project.catalog_id, project.id, project.updated.isoformat(),
+                                serializer.get_read_only(project))
+
     @action(detail=True, permission_classes=(IsAuthenticated, ))
+    @etag(etag_func='overview_etag_func')
     def overview(self, request, pk=None):
         project = self.get_object()
         project.catalog = Catalog.objects.prefetch_related(
@@ -68,9 +79,35 @@ class ProjectViewSet(ModelViewSet):
 
     @action(detail=True, permission_classes=(HasModelPermission | HasObjectPermission, ))
     def resolve(self, request, pk=None):
+        project = self.get_object()
+
+        if 'conditions' in request.GET or 'questionset' in request.GET:
+            # resolve a batch of conditions, given by id or by a question set of the project's catalog
+            conditions = Condition.objects.none()
+
+            condition_ids = [condition_id for condition_id in request.GET.getlist('conditions') if condition_id.isdigit()]
+            if condition_ids:
+                conditions |= Condition.objects.filter(pk__in=condition_ids)
+
+            questionset_id = request.GET.get('questionset')
+            if questionset_id and questionset_id.isdigit():
+                questionsets = QuestionSet.objects.filter(pk=questionset_id, section__catalog=project.catalog)
+                conditions |= Condition.objects.filter(questionsets__in=questionsets)
+                conditions |= Condition.objects.filter(optionsets__questions__questionset__in=questionsets)
+
+            # the values of the project are fetched only once by the resolver
+            resolver = ConditionResolver(project)
+
+            return Response({
+                'results': {
+                    condition.id: resolver.resolve(condition)
+                    for condition in conditions.distinct()
+                }
+            })
+
         try:
             condition = Condition.objects.get(pk=request.GET.get('condition'))
-            return Response({'result': condition.resolve(self.get_object(), None)})
+            return Response({'result': condition.resolve(project, None)})
         except Condition.DoesNotExist:
             return Response({'result': False})
 
@@ -254,10 +291,22 @@ class ProjectQuestionSetViewSet(ProjectNestedViewSetMixin, RetrieveCacheResponse
     def get_queryset(self):
         return QuestionSet.objects.order_by_catalog(self.project.catalog)
 
+    def object_cache_key_func(self, **kwargs):
+        # add the version of the catalog to the cache key, so that changes appear instantly
+        return '{}-{}'.format(default_object_cache_key_func(**kwargs),
+                              get_catalog_version(self.project.catalog_id))
+
+    def object_etag_func(self, **kwargs):
+        return get_catalog_etag(self.project.catalog_id, self.kwargs.get('pk'))
+
+    @etag(etag_func='object_etag_func')
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def dispatch(self, *args, **kwargs):
         response = super().dispatch(*args, **kwargs)
 
-        if response.status_code == 200 and kwargs.get('pk'):
+        if response.status_code in (200, 304) and kwargs.get('pk'):
             try:
                 continuation = Continuation.objects.get(project=self.project, user=self.request.user)
             except Continuation.DoesNotExist:
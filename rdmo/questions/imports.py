@@ -3,7 +3,7 @@ import logging
 from django.contrib.sites.models import Site
 
 from rdmo.conditions.models import Condition
-from rdmo.core.imports import (fetch_parents, get_foreign_field,
+from rdmo.core.imports import (fetch_parents, get_foreign_field, get_instance,
                                get_m2m_instances, set_common_fields,
                                set_lang_field, validate_instance)
 from rdmo.domain.models import Attribute
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 def import_catalog(element, save=False):
     try:
-        catalog = Catalog.objects.get(uri=element.get('uri'))
+        catalog = get_instance(Catalog, element.get('uri'))
     except Catalog.DoesNotExist:
         catalog = Catalog()
 
@@ -49,7 +49,7 @@ def import_section(element, parent_uri=False, save=False):
         parent_uri = element.get('catalog')
 
     try:
-        section = Section.objects.get(uri=element.get('uri'), catalog__uri=parent_uri)
+        section = get_instance(Section, element.get('uri'), 'catalog', parent_uri)
     except Section.DoesNotExist:
         section = Section()
 
@@ -79,7 +79,7 @@ def import_questionset(element, parent_uri=False, save=False):
         parent_uri = element.get('section')
 
     try:
-        questionset = QuestionSet.objects.get(uri=element.get('uri'), section__uri=parent_uri)
+        questionset = get_instance(QuestionSet, element.get('uri'), 'section', parent_uri)
     except QuestionSet.DoesNotExist:
         questionset = QuestionSet()
 
@@ -117,7 +117,7 @@ def import_question(element, parent_uri=False, save=False):
         parent_uri = element.get('questionset')
 
     try:
-        question = Question.objects.get(uri=element.get('uri'), questionset__uri=parent_uri)
+        question = get_instance(Question, element.get('uri'), 'questionset', parent_uri)
     except Question.DoesNotExist:
         question = Question()
 
@@ -1,3 +1,4 @@
+from django.core.cache import caches
 from django.db import models
 
 from rdmo.core.managers import (AvailabilityManagerMixin,
@@ -6,6 +7,8 @@ from rdmo.core.managers import (AvailabilityManagerMixin,
                                 CurrentSiteQuerySetMixin, GroupsManagerMixin,
                                 GroupsQuerySetMixin)
 
+from .utils import get_catalog_version
+
 
 class CatalogQuestionSet(CurrentSiteQuerySetMixin, GroupsQuerySetMixin, AvailabilityQuerySetMixin, models.QuerySet):
 
@@ -27,28 +30,18 @@ class QuestionSetQuerySet(models.QuerySet):
     def order_by_catalog(self, catalog):
         return self.filter(section__catalog=catalog).order_by('section__order', 'order')
 
-    def _get_pk_list(self, pk):
-        catalog = self.get(pk=pk).section.catalog
-
-        pk_list = list(self.order_by_catalog(catalog).values_list('pk', flat=True))
-        current_index = pk_list.index(int(pk))
-
-        return pk_list, current_index
-
     def get_prev(self, pk):
-        pk_list, current_index = self._get_pk_list(pk)
+        prev_pk = self.model.objects.get_prev_pk(self.get(pk=pk))
 
-        if current_index > 0:
-            prev_pk = pk_list[current_index - 1]
+        if prev_pk is not None:
             return self.get(pk=prev_pk)
         else:
             raise self.model.DoesNotExist('QuestionSet has no previous QuestionSet. It is the first one.')
 
     def get_next(self, pk):
-        pk_list, current_index = self._get_pk_list(pk)
+        next_pk = self.model.objects.get_next_pk(self.get(pk=pk))
 
-        if current_index < len(pk_list) - 1:
-            next_pk = pk_list[current_index + 1]
+        if next_pk is not None:
             return self.get(pk=next_pk)
         else:
             raise self.model.DoesNotExist('QuestionSet has no next QuestionSet. It is the last one.')
@@ -68,6 +61,40 @@ class QuestionSetManager(models.Manager):
     def get_next(self, pk):
         return self.get_queryset().get_next(pk)
 
+    def get_navigation(self, catalog_id):
+        # the navigation for a catalog consists of the ordered list of question set ids
+        # and a dict mapping each id to its position, it is stored in the api cache
+        # using the version of the catalog, so that changes appear instantly
+        cache_key = 'questionset-navigation-{}-{}'.format(catalog_id, get_catalog_version(catalog_id))
+        navigation = caches['api'].get(cache_key)
+
+        if navigation is None:
+            pk_list = list(self.order_by_catalog(catalog_id).values_list('pk', flat=True))
+            navigation = (pk_list, {pk: index for index, pk in enumerate(pk_list)})
+            caches['api'].set(cache_key, navigation)
+
+        return navigation
+
+    def get_prev_pk(self, questionset):
+        pk_list, positions = self.get_navigation(questionset.section.catalog_id)
+
+        try:
+            index = positions[questionset.pk]
+        except KeyError:
+            return None
+
+        return pk_list[index - 1] if index > 0 else None
+
+    def get_next_pk(self, questionset):
+        pk_list, positions = self.get_navigation(questionset.section.catalog_id)
+
+        try:
+            index = positions[questionset.pk]
+        except KeyError:
+            return None
+
+        return pk_list[index + 1] if index < len(pk_list) - 1 else None
+
 
 class QuestionQuerySet(models.QuerySet):
 
@@ -1,17 +1,21 @@
 from django.conf import settings
 from django.contrib.auth.models import Group
 from django.contrib.sites.models import Site
-from django.core.cache import caches
 from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
 from rdmo.conditions.models import Condition
 from rdmo.core.constants import VALUE_TYPE_CHOICES
 from rdmo.core.models import Model, TranslationMixin
-from rdmo.core.utils import copy_model, get_language_fields, join_url
+from rdmo.core.utils import (copy_model, get_language_fields, join_url,
+                             update_uris)
 from rdmo.domain.models import Attribute
 
 from .managers import CatalogManager, QuestionManager, QuestionSetManager
+from .utils import (defer_catalog_version_updates, update_catalog_version,
+                    update_catalog_versions)
 
 
 class Catalog(Model, TranslationMixin):
@@ -126,8 +130,14 @@ class Catalog(Model, TranslationMixin):
         self.uri = self.build_uri(self.uri_prefix, self.key)
         super().save(*args, **kwargs)
 
-        for section in self.sections.all():
-            section.save()
+        with defer_catalog_version_updates():
+            # update the paths and uris of all descendants with one bulk_update for each level
+            sections = update_uris(self.sections.all(), {self.pk: self})
+            questionsets = update_uris(QuestionSet.objects.filter(section__catalog=self), sections)
+            update_uris(Question.objects.filter(questionset__section__catalog=self), questionsets)
+
+            # update the version of the catalog so that changes appear instantly
+            update_catalog_version(self.pk)
 
     def copy(self, uri_prefix, key):
         # create a new title
@@ -242,14 +252,33 @@ class Section(Model, TranslationMixin):
     def __str__(self):
         return self.path
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # store the catalog as loaded from the database to detect a move in save
+        instance._loaded_catalog_id = instance.__dict__.get('catalog_id')
+        return instance
+
     def save(self, *args, **kwargs):
         self.path = self.build_path(self.key, self.catalog)
         self.uri = self.build_uri(self.uri_prefix, self.path)
 
         super().save(*args, **kwargs)
 
-        for questionsets in self.questionsets.all():
-            questionsets.save()
+        with defer_catalog_version_updates():
+            # update the paths and uris of all descendants with one bulk_update for each level
+            questionsets = update_uris(self.questionsets.all(), {self.pk: self})
+            update_uris(Question.objects.filter(questionset__section=self), questionsets)
+
+            # update the version of the catalog so that changes appear instantly
+            update_catalog_version(self.catalog_id)
+
+            # the section was moved, therefore the previous catalog has changed as well
+            loaded_catalog_id = getattr(self, '_loaded_catalog_id', None)
+            if loaded_catalog_id != self.catalog_id:
+                update_catalog_version(loaded_catalog_id)
+
+        self._loaded_catalog_id = self.catalog_id
 
     def copy(self, uri_prefix, key, catalog=None):
         section = copy_model(self, uri_prefix=uri_prefix, key=key, catalog=catalog or self.catalog)
@@ -457,17 +486,33 @@ class QuestionSet(Model, TranslationMixin):
     def __str__(self):
         return self.path
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # store the section as loaded from the database to detect a move in save
+        instance._loaded_section_id = instance.__dict__.get('section_id')
+        return instance
+
     def save(self, *args, **kwargs):
         self.path = self.build_path(self.key, self.section)
         self.uri = self.build_uri(self.uri_prefix, self.path)
 
         super().save(*args, **kwargs)
 
-        for question in self.questions.all():
-            question.save()
+        with defer_catalog_version_updates():
+            # update the paths and uris of all questions with one bulk_update
+            update_uris(self.questions.all(), {self.pk: self})
+
+            # update the version of the catalog so that changes appear instantly
+            update_catalog_version(self.section.catalog_id)
+
+            # the question set was moved, therefore the catalog of the previous section has changed as well
+            loaded_section_id = getattr(self, '_loaded_section_id', None)
+            if loaded_section_id is not None and loaded_section_id != self.section_id:
+                update_catalog_version(Section.objects.filter(pk=loaded_section_id)
+                                                      .values_list('catalog_id', flat=True).first())
 
-        # invalidate the cache so that changes appear instantly
-        caches['api'].clear()
+        self._loaded_section_id = self.section_id
 
     def copy(self, uri_prefix, key, section=None):
         questionset = copy_model(self, uri_prefix=uri_prefix, key=key, section=section or self.section, attribute=self.attribute)
@@ -740,13 +785,29 @@ class Question(Model, TranslationMixin):
     def __str__(self):
         return self.path
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # store the question set as loaded from the database to detect a move in save
+        instance._loaded_questionset_id = instance.__dict__.get('questionset_id')
+        return instance
+
     def save(self, *args, **kwargs):
         self.path = self.build_path(self.key, self.questionset)
         self.uri = self.build_uri(self.uri_prefix, self.path)
         super().save(*args, **kwargs)
 
-        # invalidate the cache so that changes appear instantly
-        caches['api'].clear()
+        with defer_catalog_version_updates():
+            # update the version of the catalog so that changes appear instantly
+            update_catalog_version(self.questionset.section.catalog_id)
+
+            # the question was moved, therefore the catalog of the previous question set has changed as well
+            loaded_questionset_id = getattr(self, '_loaded_questionset_id', None)
+            if loaded_questionset_id is not None and loaded_questionset_id != self.questionset_id:
+                update_catalog_version(QuestionSet.objects.filter(pk=loaded_questionset_id)
+                                                          .values_list('section__catalog_id', flat=True).first())
+
+        self._loaded_questionset_id = self.questionset_id
 
     def copy(self, uri_prefix, key, questionset=None):
         question = copy_model(self, uri_prefix=uri_prefix, key=key, questionset=questionset or self.questionset, attribute=self.attribute)
@@ -800,3 +861,63 @@ class Question(Model, TranslationMixin):
     def build_uri(cls, uri_prefix, path):
         assert path
         return join_url(uri_prefix or settings.DEFAULT_URI_PREFIX, '/questions/', path)
+
+
+@receiver(post_delete, sender=Section)
+def post_delete_section(sender, instance, **kwargs):
+    update_catalog_version(instance.catalog_id)
+
+
+@receiver(post_delete, sender=QuestionSet)
+def post_delete_questionset(sender, instance, **kwargs):
+    try:
+        update_catalog_version(instance.section.catalog_id)
+    except Section.DoesNotExist:
+        # the section was deleted as well, see post_delete_section
+        pass
+
+
+@receiver(post_delete, sender=Question)
+def post_delete_question(sender, instance, **kwargs):
+    try:
+        update_catalog_version(instance.questionset.section.catalog_id)
+    except (QuestionSet.DoesNotExist, Section.DoesNotExist):
+        # the question set was deleted as well, see post_delete_questionset
+        pass
+
+
+@receiver(m2m_changed, sender=Catalog.sites.through)
+def m2m_changed_catalog(sender, instance, **kwargs):
+    if isinstance(instance, Catalog):
+        update_catalog_version(instance.pk)
+
+
+@receiver(m2m_changed, sender=QuestionSet.conditions.through)
+def m2m_changed_questionset(sender, instance, **kwargs):
+    if isinstance(instance, QuestionSet):
+        update_catalog_version(instance.section.catalog_id)
+    else:
+        update_catalog_versions()
+
+
+@receiver(m2m_changed, sender=Question.optionsets.through)
+@receiver(m2m_changed, sender=Question.conditions.through)
+def m2m_changed_question(sender, instance, **kwargs):
+    if isinstance(instance, Question):
+        update_catalog_version(instance.questionset.section.catalog_id)
+    else:
+        update_catalog_versions()
+
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_delete, sender=Attribute)
+@receiver(post_save, sender=Condition)
+@receiver(post_delete, sender=Condition)
+@receiver(post_save, sender='options.OptionSet')
+@receiver(post_delete, sender='options.OptionSet')
+@receiver(post_save, sender='options.Option')
+@receiver(post_delete, sender='options.Option')
+@receiver(m2m_changed, sender='options.OptionSet_conditions')
+def update_shared_elements(sender, **kwargs):
+    # attributes, conditions, option sets and options can be used by any catalog
+    update_catalog_versions()
@@ -26,6 +26,26 @@ def test_catalog_copy(db):
         assert new_instance.sections.count() == instance.sections.count()
 
 
+def test_catalog_save_key(db, django_assert_max_num_queries):
+    catalog = Catalog.objects.first()
+    catalog.key = 'changed'
+
+    with django_assert_max_num_queries(10):
+        catalog.save()
+
+    for section in Section.objects.filter(catalog=catalog):
+        assert section.path == Section.build_path(section.key, catalog)
+        assert section.uri == Section.build_uri(section.uri_prefix, section.path)
+
+    for questionset in QuestionSet.objects.filter(section__catalog=catalog):
+        assert questionset.path.startswith('changed/')
+        assert questionset.uri == QuestionSet.build_uri(questionset.uri_prefix, questionset.path)
+
+    for question in Question.objects.filter(questionset__section__catalog=catalog):
+        assert question.path == Question.build_path(question.key, question.questionset)
+        assert question.uri == Question.build_uri(question.uri_prefix, question.path)
+
+
 def test_section_str(db):
     instances = Section.objects.all()
     for instance in instances:
@@ -49,6 +69,17 @@ def test_section_copy(db):
         assert new_instance.questionsets.count() == instance.questionsets.count()
 
 
+def test_section_save_key(db):
+    section = Section.objects.first()
+    section.key = 'changed'
+    section.save()
+
+    for question in Question.objects.filter(questionset__section=section):
+        assert question.path == Question.build_path(question.key, question.questionset)
+        assert question.uri == Question.build_uri(question.uri_prefix, question.path)
+        assert question.path.split('/')[1] == 'changed'
+
+
 def test_questionset_str(db):
     instances = QuestionSet.objects.all()
     for instance in instances:
@@ -74,6 +105,37 @@ def test_questionset_copy(db):
         assert new_instance.questions.count() == instance.questions.count()
 
 
+def test_questionset_prev_next(db):
+    for catalog in Catalog.objects.all():
+        pk_list = list(QuestionSet.objects.order_by_catalog(catalog).values_list('pk', flat=True))
+
+        for index, questionset in enumerate(QuestionSet.objects.order_by_catalog(catalog)):
+            assert QuestionSet.objects.get_prev_pk(questionset) == (pk_list[index - 1] if index > 0 else None)
+            assert QuestionSet.objects.get_next_pk(questionset) == (pk_list[index + 1] if index < len(pk_list) - 1 else None)
+
+
+def test_questionset_navigation_section_order(db):
+    catalog = Catalog.objects.first()
+    pk_list, positions = QuestionSet.objects.get_navigation(catalog.id)
+
+    # move the first section to the end
+    section = catalog.sections.order_by('order').first()
+    section.order = catalog.sections.order_by('order').last().order + 1
+    section.save()
+
+    questionsets = list(section.questionsets.order_by('order').values_list('pk', flat=True))
+    assert QuestionSet.objects.get_navigation(catalog.id)[0][-len(questionsets):] == questionsets
+
+
+def test_questionset_navigation_delete(db):
+    catalog = Catalog.objects.first()
+    pk_list, positions = QuestionSet.objects.get_navigation(catalog.id)
+
+    QuestionSet.objects.get(pk=pk_list[0]).delete()
+
+    assert QuestionSet.objects.get_navigation(catalog.id)[0] == pk_list[1:]
+
+
 def test_question_str(db):
     instances = Question.objects.all()
     for instance in instances:
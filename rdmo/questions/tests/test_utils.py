@@ -0,0 +1,101 @@
+import pytest
+
+from django.db import transaction
+
+from ..models import Catalog, Question, QuestionSet, Section
+from ..utils import (defer_catalog_version_updates, get_catalog_version,
+                     update_catalog_version)
+
+
+def test_get_catalog_version(db):
+    catalog = Catalog.objects.first()
+    assert get_catalog_version(catalog.id) == get_catalog_version(catalog.id)
+
+
+def test_update_catalog_version(db):
+    catalog = Catalog.objects.first()
+    version = get_catalog_version(catalog.id)
+
+    update_catalog_version(catalog.id)
+    assert get_catalog_version(catalog.id) != version
+
+
+def test_update_catalog_version_rollback(db):
+    catalog = Catalog.objects.first()
+    version = get_catalog_version(catalog.id)
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            update_catalog_version(catalog.id)
+            raise RuntimeError
+
+    assert get_catalog_version(catalog.id) == version
+
+
+def test_update_catalog_version_question_save(db):
+    question = Question.objects.first()
+    catalog_id = question.questionset.section.catalog_id
+    versions = {catalog.id: get_catalog_version(catalog.id) for catalog in Catalog.objects.all()}
+
+    question.save()
+
+    for catalog in Catalog.objects.all():
+        if catalog.id == catalog_id:
+            assert get_catalog_version(catalog.id) != versions[catalog.id]
+        else:
+            assert get_catalog_version(catalog.id) == versions[catalog.id]
+
+
+def test_defer_catalog_version_updates(db):
+    catalog = Catalog.objects.first()
+    version = get_catalog_version(catalog.id)
+
+    with defer_catalog_version_updates():
+        for question in Question.objects.filter(questionset__section__catalog=catalog):
+            question.save()
+
+        assert get_catalog_version(catalog.id) == version
+
+    assert get_catalog_version(catalog.id) != version
+
+
+def test_update_catalog_version_section_move(db):
+    section = Section.objects.first()
+    catalog = Catalog.objects.exclude(id=section.catalog_id).first()
+    versions = {catalog.id: get_catalog_version(catalog.id) for catalog in Catalog.objects.all()}
+    loaded_catalog_id = section.catalog_id
+
+    section.catalog = catalog
+    section.save()
+
+    assert get_catalog_version(catalog.id) != versions[catalog.id]
+    assert get_catalog_version(loaded_catalog_id) != versions[loaded_catalog_id]
+
+
+def test_update_catalog_version_questionset_move(db):
+    questionset = QuestionSet.objects.first()
+    catalog = Catalog.objects.exclude(id=questionset.section.catalog_id).first()
+    section = Section.objects.create(uri_prefix=catalog.uri_prefix, key='new', catalog=catalog)
+    versions = {catalog.id: get_catalog_version(catalog.id) for catalog in Catalog.objects.all()}
+    loaded_catalog_id = questionset.section.catalog_id
+
+    questionset.section = section
+    questionset.save()
+
+    assert get_catalog_version(section.catalog_id) != versions[section.catalog_id]
+    assert get_catalog_version(loaded_catalog_id) != versions[loaded_catalog_id]
+
+
+def test_update_catalog_version_question_move(db):
+    question = Question.objects.first()
+    catalog = Catalog.objects.exclude(id=question.questionset.section.catalog_id).first()
+    section = Section.objects.create(uri_prefix=catalog.uri_prefix, key='new', catalog=catalog)
+    questionset = QuestionSet.objects.create(uri_prefix=catalog.uri_prefix, key='new', section=section)
+    versions = {catalog.id: get_catalog_version(catalog.id) for catalog in Catalog.objects.all()}
+    loaded_catalog_id = question.questionset.section.catalog_id
+
+    question.questionset = questionset
+    question.save()
+
+    assert get_catalog_version(questionset.section.catalog_id) != versions[questionset.section.catalog_id]
+    assert get_catalog_version(loaded_catalog_id) != versions[loaded_catalog_id]
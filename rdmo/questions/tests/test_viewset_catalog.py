@@ -97,6 +97,24 @@ def test_nested(db, client, username, password):
         assert response.status_code == status_map['detail'][username], response.json()
 
 
+def test_nested_etag(db, client):
+    client.login(username='editor', password='editor')
+    instance = Catalog.objects.first()
+
+    url = reverse(urlnames['nested'], args=[instance.pk])
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.has_header('ETag')
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+    instance.sections.first().save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 200
+
+
 @pytest.mark.parametrize('username,password', users)
 def test_create(db, client, username, password):
     client.login(username=username, password=password)
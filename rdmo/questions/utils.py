@@ -0,0 +1,45 @@
+import hashlib
+
+from django.utils.translation import get_language
+
+from rdmo.core.cache import defer_version_updates, get_version, update_version
+
+
+def get_catalog_version_cache_key(catalog_id=None):
+    if catalog_id is None:
+        # the version for the elements shared by all catalogs
+        return 'catalog-version'
+    else:
+        return 'catalog-version-{}'.format(catalog_id)
+
+
+def get_catalog_version(catalog_id):
+    # the version of a catalog is a random token, which is replaced whenever the catalog
+    # (or one of its elements) changes, it is part of the keys of all cached catalog content,
+    # it also contains the version of the attributes, option sets, options and conditions,
+    # which can be used by all catalogs
+    return '{}-{}'.format(get_version(get_catalog_version_cache_key(catalog_id)),
+                          get_version(get_catalog_version_cache_key()))
+
+
+def update_catalog_version(catalog_id):
+    if catalog_id is not None:
+        update_version(get_catalog_version_cache_key(catalog_id))
+
+
+def update_catalog_versions():
+    # update the versions of all catalogs at once
+    update_version(get_catalog_version_cache_key())
+
+
+def get_catalog_etag(catalog_id, *args):
+    # a strong etag for content derived from a catalog, the language
+    # and the additional arguments (e.g. ids or timestamps)
+    etag = [get_catalog_version(catalog_id), get_language() or ''] + [str(arg) for arg in args]
+    return hashlib.sha1('-'.join(etag).encode()).hexdigest()
+
+
+def defer_catalog_version_updates():
+    # collect the updates of the catalog versions (e.g. during an import)
+    # and perform them only once for every catalog at the end
+    return defer_version_updates()
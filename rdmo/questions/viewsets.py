@@ -5,6 +5,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
+from rest_framework_extensions.etag.decorators import etag
 
 from rdmo.core.constants import VALUE_TYPE_CHOICES
 from rdmo.core.exports import XMLResponse
@@ -26,6 +27,7 @@ from .serializers.v1 import (CatalogIndexSerializer, CatalogNestedSerializer,
                              QuestionSetNestedSerializer,
                              QuestionSetSerializer, SectionIndexSerializer,
                              SectionNestedSerializer, SectionSerializer)
+from .utils import get_catalog_etag
 
 
 class CatalogViewSet(CopyModelMixin, ModelViewSet):
@@ -41,7 +43,13 @@ class CatalogViewSet(CopyModelMixin, ModelViewSet):
         'comment'
     )
 
+    def nested_etag_func(self, **kwargs):
+        projects_count = get_object_or_404(self.get_queryset().values_list('projects_count', flat=True),
+                                           pk=self.kwargs.get('pk'))
+        return get_catalog_etag(self.kwargs.get('pk'), projects_count)
+
     @action(detail=True)
+    @etag(etag_func='nested_etag_func')
     def nested(self, request, pk):
         queryset = self.get_queryset().prefetch_related(
             'sections',
@@ -2,9 +2,9 @@ import logging
 
 from django.contrib.sites.models import Site
 from rdmo.conditions.models import Condition
-from rdmo.core.imports import (get_foreign_field, get_m2m_instances,
-                               set_common_fields, set_lang_field,
-                               validate_instance)
+from rdmo.core.imports import (get_foreign_field, get_instance,
+                               get_m2m_instances, set_common_fields,
+                               set_lang_field, validate_instance)
 from rdmo.domain.models import Attribute
 from rdmo.questions.models import Catalog
 
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 def import_task(element, save=False):
     try:
-        task = Task.objects.get(uri=element.get('uri'))
+        task = get_instance(Task, element.get('uri'))
     except Task.DoesNotExist:
         task = Task()
 
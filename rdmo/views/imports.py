@@ -2,8 +2,9 @@ import logging
 
 from django.contrib.sites.models import Site
 
-from rdmo.core.imports import (get_m2m_instances, set_common_fields,
-                               set_lang_field, validate_instance)
+from rdmo.core.imports import (get_instance, get_m2m_instances,
+                               set_common_fields, set_lang_field,
+                               validate_instance)
 from rdmo.questions.models import Catalog
 
 from .models import View
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 def import_view(element, save=False):
     try:
-        view = View.objects.get(uri=element.get('uri'))
+        view = get_instance(View, element.get('uri'))
     except View.DoesNotExist:
         view = View()
 
@@ -1,17 +1,26 @@
+import hashlib
+
 from django.conf import settings
 from django.contrib.auth.models import Group
 from django.contrib.sites.models import Site
+from django.core.cache import caches
 from django.db import models
 from django.template import Context, Template
+from django.utils.translation import get_language
 from django.utils.translation import ugettext_lazy as _
 
-from rdmo.conditions.models import Condition
+from rdmo.core.cache import get_version
 from rdmo.core.models import TranslationMixin
 from rdmo.core.utils import copy_model, get_pandoc_version, join_url
+from rdmo.projects.utils import get_project_version
 from rdmo.questions.models import Catalog
+from rdmo.questions.utils import get_catalog_version_cache_key
 
 from .managers import ViewManager
-from .utils import ProjectWrapper
+from .utils import ConditionsWrapper, ProjectWrapper
+
+# process wide cache for the compiled templates of the views
+templates = {}
 
 
 class View(models.Model, TranslationMixin):
@@ -131,6 +140,9 @@ class View(models.Model, TranslationMixin):
         self.uri = self.build_uri(self.uri_prefix, self.key)
         super().save(*args, **kwargs)
 
+        # invalidate the compiled template of this view
+        templates.pop(self.pk, None)
+
     def copy(self, uri_prefix, key):
         view = copy_model(self, uri_prefix=uri_prefix, key=key)
 
@@ -153,19 +165,59 @@ class View(models.Model, TranslationMixin):
     def is_locked(self):
         return self.locked
 
+    @property
+    def template_hash(self):
+        return hashlib.sha1((self.template or '').encode()).hexdigest()
+
+    @property
+    def compiled_template(self):
+        # the compiled template is cached per process, the cache key is a hash of the
+        # template, so that changes in other processes are not missed
+        key = self.template_hash
+
+        try:
+            cached_key, template = templates[self.pk]
+            if cached_key == key:
+                return template
+        except KeyError:
+            pass
+
+        template = Template(self.template)
+        if self.pk is not None:
+            templates[self.pk] = (key, template)
+
+        return template
+
     def render(self, project, snapshot=None, export_format=None):
         # render the template to a html string
         # it is important not to use models here
-
-        return Template(self.template).render(Context({
-            'project': ProjectWrapper(project, snapshot),
-            'conditions': {
-                condition.key: condition.resolve(project, snapshot)
-                for condition in Condition.objects.select_related('source')
-            },
-            'format': export_format,
-            'pandoc_version': get_pandoc_version()
-        }))
+        pandoc_version = get_pandoc_version()
+
+        # the rendered view is cached, the key contains the versions of the project tree, the elements
+        # used by all catalogs (attributes, options, conditions) and a hash of the template
+        cache_key = 'view-{}'.format(hashlib.sha1('-'.join([
+            str(self.id),
+            self.template_hash,
+            str(project.id),
+            str(snapshot.id if snapshot else ''),
+            get_language() or '',
+            export_format or '',
+            str(pandoc_version),
+            get_project_version(project),
+            get_version(get_catalog_version_cache_key())
+        ]).encode()).hexdigest())
+
+        rendered_view = caches['default'].get(cache_key)
+        if rendered_view is None:
+            rendered_view = self.compiled_template.render(Context({
+                'project': ProjectWrapper(project, snapshot),
+                'conditions': ConditionsWrapper(project, snapshot),
+                'format': export_format,
+                'pandoc_version': pandoc_version
+            }))
+            caches['default'].set(cache_key, rendered_view)
+
+        return rendered_view
 
     @classmethod
     def build_uri(cls, uri_prefix, key):
@@ -1,5 +1,3 @@
-from urllib.parse import urlparse
-
 from django import template
 from rdmo.core.constants import (VALUE_TYPE_DATETIME, VALUE_TYPE_INTEGER,
                                  VALUE_TYPE_TEXT)
@@ -24,20 +22,7 @@ def get_values(context, attribute, set_index='*', index='*', project=None):
     elif attribute == 'project/updated':
         return [Value(text=project.updated, value_type=VALUE_TYPE_DATETIME).as_dict]
     else:
-        values = project._values
-
-        if urlparse(attribute).scheme:
-            values = filter(lambda value: value.attribute and (value.attribute.uri == attribute), values)
-        else:
-            values = filter(lambda value: value.attribute and (value.attribute.path == attribute), values)
-
-        if set_index != '*':
-            values = filter(lambda value: value.set_index == set_index, values)
-
-        if index != '*':
-            values = filter(lambda value: value.collection_index == index, values)
-
-        return list(map(lambda value: value.as_dict, values))
+        return [value.as_dict for value in project._get_values(attribute, set_index, index)]
 
 
 @register.simple_tag(takes_context=True)
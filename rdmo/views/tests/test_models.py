@@ -1,3 +1,7 @@
+from django.template import Context
+
+from rdmo.projects.models import Project
+
 from ..models import View
 
 
@@ -24,3 +28,61 @@ def test_view_copy(db):
         assert list(new_instance.catalogs.values('id')) == list(new_instance.catalogs.values('id'))
         assert list(new_instance.sites.values('id')) == list(new_instance.sites.values('id'))
         assert list(new_instance.groups.values('id')) == list(new_instance.groups.values('id'))
+
+
+def test_view_render_cache(db, django_assert_num_queries):
+    project = Project.objects.get(pk=1)
+    view = View.objects.first()
+
+    rendered_view = view.render(project)
+
+    with django_assert_num_queries(0):
+        assert view.render(project) == rendered_view
+
+
+def test_view_render_cache_value(db):
+    project = Project.objects.get(pk=1)
+    view = View.objects.get(pk=1)
+    view.template = '{% load view_tags %}{% render_value "individual/single/text" %}'
+    view.save()
+
+    assert 'Lorem ipsum' in view.render(project)
+
+    value = project.values.get(snapshot=None, attribute__path='individual/single/text')
+    value.text = 'changed'
+    value.save()
+
+    assert 'changed' in view.render(project)
+
+
+def test_view_render_cache_template(db):
+    project = Project.objects.get(pk=1)
+    view = View.objects.get(pk=1)
+
+    view.template = 'a'
+    view.save()
+    assert view.render(project) == 'a'
+
+    view.template = 'b'
+    view.save()
+    assert view.render(project) == 'b'
+
+
+def test_view_compiled_template(db):
+    view = View.objects.get(pk=1)
+    template = view.compiled_template
+
+    assert view.compiled_template is template
+    assert View.objects.get(pk=1).compiled_template is template
+
+    view.template = 'changed'
+    assert view.compiled_template is not template
+    assert view.compiled_template.render(Context()) == 'changed'
+
+
+def test_view_compiled_template_save(db):
+    view = View.objects.get(pk=1)
+    template = view.compiled_template
+
+    view.save()
+    assert view.compiled_template is not template
@@ -0,0 +1,45 @@
+import pytest
+
+from rdmo.conditions.models import Condition
+from rdmo.projects.models import Project
+
+from ..utils import ConditionsWrapper
+
+projects = [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('project_id', projects)
+def test_conditions_wrapper(db, project_id):
+    project = Project.objects.get(pk=project_id)
+    conditions = ConditionsWrapper(project)
+
+    assert len(conditions) == Condition.objects.count()
+    for condition in Condition.objects.all():
+        assert conditions[condition.key] == condition.resolve(project)
+
+
+def test_conditions_wrapper_missing_key(db, django_assert_num_queries):
+    project = Project.objects.get(pk=1)
+    conditions = ConditionsWrapper(project)
+
+    with pytest.raises(KeyError):
+        conditions['missing']
+
+    with django_assert_num_queries(0):
+        with pytest.raises(KeyError):
+            conditions['missing']
+
+        assert conditions.get('missing') is None
+
+
+def test_conditions_wrapper_cache(db, django_assert_num_queries):
+    project = Project.objects.get(pk=1)
+    condition = Condition.objects.first()
+    conditions = ConditionsWrapper(project)
+
+    # one query for the condition, one for the values of the project
+    with django_assert_num_queries(2):
+        conditions[condition.key]
+
+    with django_assert_num_queries(0):
+        conditions[condition.key]
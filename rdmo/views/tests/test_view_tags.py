@@ -88,3 +88,16 @@ def test_get_set_value(context, values):
     path = 'set/single/text'
     for value_set in get_sets(context, 'set'):
         assert get_set_value(context, value_set, path)['id'] == values.filter(attribute__path=path, set_index=value_set['set_index']).first().id
+
+
+def test_get_values_index(context, values, django_assert_num_queries):
+    uri = 'http://example.com/terms/domain/individual/collection/text'
+    path = 'individual/collection/text'
+    path_values = list(values.filter(attribute__path=path))
+    get_values(context, path)
+
+    with django_assert_num_queries(0):
+        assert get_values(context, uri) == get_values(context, path)
+        for value in path_values:
+            assert get_value(context, path, value.set_index, value.collection_index)['id'] == value.id
+            assert get_value(context, uri, value.set_index, value.collection_index)['id'] == value.id
@@ -1,6 +1,12 @@
+from collections.abc import Mapping
+from urllib.parse import urlparse
+
 from django.utils.functional import cached_property
 from mptt.utils import get_cached_trees
 
+from rdmo.conditions.models import Condition
+from rdmo.conditions.utils import ConditionResolver
+
 
 class ProjectWrapper(object):
 
@@ -48,9 +54,65 @@ class ProjectWrapper(object):
     def _values(self):
         return list(self._project.values.filter(snapshot=self._snapshot).select_related('attribute', 'option'))
 
+    @cached_property
+    def _values_index(self):
+        # the values are stored by attribute uri and by attribute path, each together with the set index
+        # and the collection index, where '*' matches all indexes (like in the get_values template tag),
+        # an attribute is looked up by its uri if the string has a scheme and by its path otherwise
+        index = {}
+        keys = {}
+        for value in self._values:
+            if value.attribute is None:
+                continue
+
+            if value.attribute_id not in keys:
+                keys[value.attribute_id] = []
+                if value.attribute.uri and urlparse(value.attribute.uri).scheme:
+                    keys[value.attribute_id].append(value.attribute.uri)
+                if value.attribute.path and not urlparse(value.attribute.path).scheme:
+                    keys[value.attribute_id].append(value.attribute.path)
+
+            for key in keys[value.attribute_id]:
+                for set_index in (value.set_index, '*'):
+                    for collection_index in (value.collection_index, '*'):
+                        index.setdefault((key, set_index, collection_index), []).append(value)
+
+        return index
+
+    def _get_values(self, attribute, set_index='*', index='*'):
+        return self._values_index.get((attribute, set_index, index), [])
+
     def _build_tree(self, projects):
         return [{
             'id': project.id,
             'level': project.level,
             'children': self.build_tree(project.get_children())
         } for project in projects]
+
+
+class ConditionsWrapper(Mapping):
+    # a mapping from condition keys to their results for the given project (and snapshot),
+    # conditions are only resolved when they are looked up in the template and then cached
+
+    def __init__(self, project, snapshot=None):
+        self._resolver = ConditionResolver(project, snapshot)
+        self._results = {}
+
+    def __getitem__(self, key):
+        if key not in self._results:
+            # if multiple conditions share a key, the last one (ordered by uri) is used,
+            # missing keys are stored as None, since the template engine tries them repeatedly
+            condition = Condition.objects.filter(key=key).last()
+            self._results[key] = None if condition is None else self._resolver.resolve(condition)
+
+        result = self._results[key]
+        if result is None:
+            raise KeyError(key)
+
+        return result
+
+    def __iter__(self):
+        return iter(Condition.objects.order_by('key').values_list('key', flat=True).distinct())
+
+    def __len__(self):
+        return Condition.objects.values('key').distinct().count()